@@ -47,6 +47,8 @@ from scraper import (  # noqa: F401, E402
     # Patterns
     DYNAMIC_ID_PATTERNS,
     DYNAMIC_CLASS_PATTERNS,
+    DYNAMIC_ID_LABELS,
+    DYNAMIC_CLASS_LABELS,
     SOFTWARE_SIGNATURES,
     check_dynamic_id,
     check_dynamic_class,
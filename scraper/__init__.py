@@ -23,6 +23,8 @@ from .models import (  # noqa: F401
 from .patterns import (  # noqa: F401
     DYNAMIC_ID_PATTERNS,
     DYNAMIC_CLASS_PATTERNS,
+    DYNAMIC_ID_LABELS,
+    DYNAMIC_CLASS_LABELS,
     SOFTWARE_SIGNATURES,
     check_dynamic_id,
     check_dynamic_class,
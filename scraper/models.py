@@ -8,7 +8,7 @@ from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class SelectorSuggestion:
     """A recommended Pendo CSS selector for a specific element."""
     element_desc: str   # Human-readable description (e.g., 'Button "Submit Order"')
@@ -17,7 +17,7 @@ class SelectorSuggestion:
     confidence: str     # excellent, good, acceptable
 
 
-@dataclass
+@dataclass(slots=True)
 class ElementAnalysis:
     """Stores analysis for a single element type."""
     total: int = 0
@@ -34,7 +34,7 @@ class ElementAnalysis:
     selector_suggestions: list = field(default_factory=list)  # List[SelectorSuggestion]
 
 
-@dataclass
+@dataclass(slots=True)
 class IframeInfo:
     """Info about an iframe found on a page."""
     src: str
@@ -42,7 +42,7 @@ class IframeInfo:
     is_cross_origin: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class ShadowDOMInfo:
     """Info about shadow DOM found on a page."""
     count: int
@@ -50,7 +50,7 @@ class ShadowDOMInfo:
     element_tags: list = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class CanvasInfo:
     """Info about canvas elements found on a page."""
     count: int
@@ -58,7 +58,7 @@ class CanvasInfo:
     dimensions: list = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class SoftwareDetection:
     """Detected software and frameworks."""
     frontend_frameworks: list = field(default_factory=list)
@@ -68,7 +68,7 @@ class SoftwareDetection:
     meta_generator: str = ''
 
 
-@dataclass
+@dataclass(slots=True)
 class PageAnalysis:
     """Stores analysis for a single page."""
     url: str
@@ -82,7 +82,7 @@ class PageAnalysis:
     canvas: Optional[CanvasInfo] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ScrapeConfig:
     """Config for running a scan."""
     max_links: int = 20
@@ -108,7 +108,7 @@ class ScrapeConfig:
     browser_slow_mo_ms: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ScanResult:
     """Results for a scan run."""
     start_url: str
@@ -5,6 +5,7 @@ set used during link extraction.
 """
 
 import re
+from functools import lru_cache
 
 
 # ---------------------------------------------------------------------------
@@ -40,10 +41,11 @@ _DYNAMIC_ID_PATTERNS_RAW = [
     (r'^(sc|css|emotion|styled)-[a-zA-Z0-9]+$', 'css-in-js', 'CSS-in-JS generated ID', True),
 ]
 
-DYNAMIC_ID_PATTERNS = [
+DYNAMIC_ID_PATTERNS = tuple(
     (re.compile(pattern, re.IGNORECASE), label, reason, has_prefix)
     for pattern, label, reason, has_prefix in _DYNAMIC_ID_PATTERNS_RAW
-]
+)
+DYNAMIC_ID_LABELS = frozenset(label for _, label, _, _ in DYNAMIC_ID_PATTERNS)
 
 
 # ---------------------------------------------------------------------------
@@ -68,10 +70,63 @@ _DYNAMIC_CLASS_PATTERNS_RAW = [
     (r'^[a-zA-Z]{1,2}[0-9]{4,}$', 'minified', 'Minified class name'),
 ]
 
-DYNAMIC_CLASS_PATTERNS = [
+DYNAMIC_CLASS_PATTERNS = tuple(
     (re.compile(pattern, re.IGNORECASE), label, reason)
     for pattern, label, reason in _DYNAMIC_CLASS_PATTERNS_RAW
-]
+)
+DYNAMIC_CLASS_LABELS = frozenset(label for _, label, _ in DYNAMIC_CLASS_PATTERNS)
+
+
+# ---------------------------------------------------------------------------
+# Fused matchers – one regex per table instead of one per row
+# ---------------------------------------------------------------------------
+
+def _fuse_patterns(raw: list[tuple]) -> tuple[re.Pattern, dict[str, tuple]]:
+    """Fuse a raw pattern table into one alternation of named groups.
+
+    Alternatives are tried left to right, so the first row that matches
+    wins – the same precedence as looping over the table.  Returns
+    (compiled, {group_name: (*row_metadata, first_inner_group)}) where
+    first_inner_group is 0 if the row has no capturing group of its own.
+    """
+    parts = []
+    meta: dict[str, tuple] = {}
+    next_group = 1
+    for index, (pattern, *row_meta) in enumerate(raw):
+        name = f'p{index}'
+        inner = re.compile(pattern).groups
+        parts.append(f'(?P<{name}>{pattern})')
+        meta[name] = (*row_meta, next_group + 1 if inner else 0)
+        next_group += 1 + inner
+    return re.compile('|'.join(parts), re.IGNORECASE), meta
+
+
+_DYNAMIC_ID_RE, _DYNAMIC_ID_META = _fuse_patterns(_DYNAMIC_ID_PATTERNS_RAW)
+_DYNAMIC_CLASS_RE, _DYNAMIC_CLASS_META = _fuse_patterns(_DYNAMIC_CLASS_PATTERNS_RAW)
+
+
+# Shared result tuples.  Every ID row has a fixed result, so each match
+# returns the same tuple for its row instead of building a new one.
+_NOT_DYNAMIC_ID = (False, '', '', False)
+_NOT_DYNAMIC_CLASS = (False, '', '', '')
+_ID_RESULTS = {label: (True, label, reason, has_prefix)
+               for _, label, reason, has_prefix in _DYNAMIC_ID_PATTERNS_RAW}
+
+# jss<digits> sits behind nine regex rows in the class table, none of which
+# can match it, so it is confirmed with str methods instead (str.isdecimal
+# is the exact equivalent of \d).
+_JSS_RESULT = next(
+    (True, label, reason, '')
+    for _, label, reason in _DYNAMIC_CLASS_PATTERNS_RAW if label == 'jss'
+)
+
+# numeric-only, uuid-* and hash-only IDs are confirmed with str predicates.
+# No earlier ID row can match them: every literal prefix holds a non-hex
+# character, and numeric-only is checked before hash-only as in the table.
+_HEX_DIGITS = '0123456789abcdefABCDEF'
+_NUMERIC_RESULT = _ID_RESULTS['numeric-only']
+_UUID_RESULT = _ID_RESULTS['uuid-*']
+_HASH_ONLY_RESULT = _ID_RESULTS['hash-only']
 
 
 # ---------------------------------------------------------------------------
@@ -129,37 +184,70 @@ _SKIP_EXTENSIONS = frozenset([
 
 
 # ---------------------------------------------------------------------------
-# Pattern checkers (use pre-compiled regexes)
+# Pattern checkers (use the fused, pre-compiled regexes)
 # ---------------------------------------------------------------------------
 
 def check_dynamic_id(element_id: str) -> tuple[bool, str, str, bool]:
     """Check if an ID looks dynamic / framework-generated.
 
     Returns (is_dynamic, label, reason, has_stable_prefix).
+    Results are cached per ID; None and '' never reach the cache.
     """
     if not element_id:
-        return False, '', '', False
+        return _NOT_DYNAMIC_ID
+    return _classify_id(element_id)
 
-    for compiled, label, reason, has_prefix in DYNAMIC_ID_PATTERNS:
-        if compiled.search(element_id):
-            return True, label, reason, has_prefix
 
-    return False, '', '', False
+@lru_cache(maxsize=8192)
+def _classify_id(element_id: str) -> tuple[bool, str, str, bool]:
+    """Uncached body of check_dynamic_id for a non-empty ID.
+
+    One anchored match against the fused table; the outermost named group
+    that matched identifies the row.
+    """
+    # str.isdecimal() is the exact equivalent of \d; lstrip() leaving
+    # nothing means every character is a hex digit.
+    if element_id[0] in _HEX_DIGITS:
+        if element_id.isdecimal():
+            return _NUMERIC_RESULT
+        if (len(element_id) >= 14 and element_id[8] == '-' and element_id[13] == '-'
+                and not element_id[:8].lstrip(_HEX_DIGITS)
+                and not element_id[9:13].lstrip(_HEX_DIGITS)):
+            return _UUID_RESULT
+        if len(element_id) >= 12 and not element_id.lstrip(_HEX_DIGITS):
+            return _HASH_ONLY_RESULT
+
+    match = _DYNAMIC_ID_RE.match(element_id)
+    if match:
+        return _ID_RESULTS[_DYNAMIC_ID_META[match.lastgroup][0]]
+
+    return _NOT_DYNAMIC_ID
 
 
 def check_dynamic_class(class_name: str) -> tuple[bool, str, str, str]:
     """Check if a CSS class looks dynamic.
 
     Returns (is_dynamic, label, reason, stable_prefix).
-    Uses re.match (anchored) consistently – patterns already use ^ anchors.
+    Results are cached per class; None and '' never reach the cache.
     """
     if not class_name:
-        return False, '', '', ''
+        return _NOT_DYNAMIC_CLASS
+    return _classify_class(class_name)
+
+
+@lru_cache(maxsize=8192)
+def _classify_class(class_name: str) -> tuple[bool, str, str, str]:
+    """Uncached body of check_dynamic_class for a non-empty class.
+
+    The stable prefix is the row's own first capturing group, if it has one.
+    """
+    if class_name[:3].lower() == 'jss' and class_name[3:].isdecimal():
+        return _JSS_RESULT
 
-    for compiled, label, reason in DYNAMIC_CLASS_PATTERNS:
-        match = compiled.match(class_name)
-        if match:
-            stable_prefix = match.group(1) if match.lastindex and match.lastindex >= 1 else ''
-            return True, label, reason, stable_prefix
+    match = _DYNAMIC_CLASS_RE.match(class_name)
+    if match:
+        label, reason, prefix_group = _DYNAMIC_CLASS_META[match.lastgroup]
+        stable_prefix = match.group(prefix_group) if prefix_group else ''
+        return True, label, reason, stable_prefix
 
-    return False, '', '', ''
+    return _NOT_DYNAMIC_CLASS
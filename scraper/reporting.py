@@ -4,6 +4,7 @@ The text report is designed for copy-paste into customer-facing documents.
 The JSON report is used for programmatic consumption and UI display.
 """
 
+from dataclasses import asdict, fields
 from datetime import datetime
 from urllib.parse import urlparse
 
@@ -19,10 +20,32 @@ from .models import (
 # URL display helper
 # ---------------------------------------------------------------------------
 
+def _url_path(url: str) -> str:
+    """Return urlparse(url).path, slicing plain http(s) URLs directly.
+
+    Anything urlparse treats specially (params, IPv6 hosts, control
+    characters or surrounding whitespace) goes through urlparse itself.
+    """
+    if url.startswith('https://'):
+        start = 8
+    elif url.startswith('http://'):
+        start = 7
+    else:
+        return urlparse(url).path
+    if ';' in url or '[' in url or ']' in url or not url.isprintable() or url[-1] == ' ':
+        return urlparse(url).path
+    end = len(url)
+    for delimiter in '?#':
+        index = url.find(delimiter, start, end)
+        if index != -1:
+            end = index
+    slash = url.find('/', start, end)
+    return url[slash:end] if slash != -1 else ''
+
+
 def get_short_url(url: str, max_len: int = 50) -> str:
     """Shorten URL for display."""
-    parsed = urlparse(url)
-    path = parsed.path
+    path = _url_path(url)
     if len(path) > max_len:
         path = '...' + path[-(max_len - 3):]
     return path if path else '/'
@@ -597,11 +620,14 @@ def generate_report(url: str, analyses: list[PageAnalysis], software: SoftwareDe
     return '\n'.join(lines)
 
 
+_ELEMENT_ANALYSIS_FIELDS = tuple(f.name for f in fields(ElementAnalysis))
+
+
 def _element_analysis_to_dict(ea: ElementAnalysis) -> dict:
     """Convert an ElementAnalysis to a JSON-serialisable dict."""
-    d = dict(ea.__dict__)
+    d = {name: getattr(ea, name) for name in _ELEMENT_ANALYSIS_FIELDS}
     # Convert SelectorSuggestion dataclasses to plain dicts.
-    d['selector_suggestions'] = [s.__dict__ for s in ea.selector_suggestions]
+    d['selector_suggestions'] = [asdict(s) for s in ea.selector_suggestions]
     return d
 
 
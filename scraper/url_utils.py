@@ -2,6 +2,7 @@
 
 import logging
 import re
+from functools import lru_cache
 from urllib.parse import urljoin, urlparse
 
 from playwright.sync_api import Page
@@ -11,18 +12,45 @@ from .patterns import _SKIP_EXTENSIONS
 log = logging.getLogger(__name__)
 
 
+_BACKREFERENCE_RE = re.compile(r'\\[1-9]|\(\?P=|\(\?\(\d')
+
+
+@lru_cache(maxsize=64)
+def _combined_pattern(patterns: tuple) -> re.Pattern | None:
+    """Compile patterns into one case-insensitive alternation.
+
+    Returns None when joining could change what matches (backreferences
+    or numbered conditionals would be renumbered) or any single pattern is
+    invalid; the caller then searches the patterns one at a time, raising
+    exactly as before.
+    """
+    if any(_BACKREFERENCE_RE.search(pattern) for pattern in patterns):
+        return None
+    try:
+        for pattern in patterns:
+            re.compile(pattern, re.IGNORECASE)
+        return re.compile(
+            '|'.join(f'(?:{pattern})' for pattern in patterns), re.IGNORECASE
+        )
+    except re.error:
+        return None
+
+
+def _matches_any(url: str, patterns: list) -> bool:
+    """Return True if any pattern is found in url, ignoring case."""
+    combined = _combined_pattern(tuple(patterns))
+    if combined is not None:
+        return combined.search(url) is not None
+    return any(re.search(pattern, url, re.IGNORECASE) for pattern in patterns)
+
+
 def url_allowed(url: str, allowlist_patterns: list, denylist_patterns: list) -> bool:
     """Check if a URL passes allow/deny patterns."""
-    if denylist_patterns:
-        for pattern in denylist_patterns:
-            if re.search(pattern, url, re.IGNORECASE):
-                return False
+    if denylist_patterns and _matches_any(url, denylist_patterns):
+        return False
     if not allowlist_patterns:
         return True
-    for pattern in allowlist_patterns:
-        if re.search(pattern, url, re.IGNORECASE):
-            return True
-    return False
+    return _matches_any(url, allowlist_patterns)
 
 
 def _has_skip_extension(path: str) -> bool:
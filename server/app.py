@@ -1,8 +1,10 @@
 """FastAPI app for running feasibility scans."""
 
 from pathlib import Path
+
+import zstandard
 from fastapi import FastAPI, HTTPException, Depends
-from fastapi.responses import FileResponse, RedirectResponse
+from fastapi.responses import FileResponse, RedirectResponse, Response
 from fastapi.staticfiles import StaticFiles
 from starlette.middleware.sessions import SessionMiddleware
 from authlib.integrations.starlette_client import OAuth
@@ -29,6 +31,27 @@ oauth.register(
 )
 
 
+def _accepts_encoding(accept_encoding: str, encoding: str) -> bool:
+    """Return True if an Accept-Encoding header lists encoding with q > 0.
+
+    A bare '*' is not taken as acceptance; the caller falls back to an
+    uncompressed response.
+    """
+    for token in accept_encoding.split(','):
+        name, _, params = token.partition(';')
+        if name.strip().lower() != encoding:
+            continue
+        for param in params.split(';'):
+            key, _, value = param.partition('=')
+            if key.strip().lower() == 'q':
+                try:
+                    return float(value) > 0
+                except ValueError:
+                    return False
+        return True
+    return False
+
+
 def get_current_user(request) -> dict:
     """Get the authenticated user from session."""
     user = request.session.get('user')
@@ -139,7 +162,17 @@ def scan_report_json(scan_id: str, request):
     scan = get_scan(scan_id)
     if not scan or not scan.get('report_json_path'):
         raise HTTPException(status_code=404, detail='Report not found')
-    return FileResponse(scan['report_json_path'], media_type='application/json')
+    path = scan['report_json_path']
+    if not path.endswith('.zst'):
+        return FileResponse(path, media_type='application/json')
+    # Stored zstd-compressed: pass it through when the client accepts zstd,
+    # otherwise decompress here.
+    headers = {'Vary': 'Accept-Encoding'}
+    if _accepts_encoding(request.headers.get('accept-encoding', ''), 'zstd'):
+        headers['Content-Encoding'] = 'zstd'
+        return FileResponse(path, media_type='application/json', headers=headers)
+    data = zstandard.decompress(Path(path).read_bytes())
+    return Response(data, media_type='application/json', headers=headers)
 
 
 if WEB_DIST.exists():
@@ -13,6 +13,7 @@ class Settings:
     allowed_google_domain: str = os.getenv('ALLOWED_GOOGLE_DOMAIN', 'pendo.io')
     session_secret: str = os.getenv('SESSION_SECRET', 'change-me')
     redis_url: str = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+    worker_concurrency: int = int(os.getenv('WORKER_CONCURRENCY', '1'))
 
 
 settings = Settings()
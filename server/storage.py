@@ -1,10 +1,16 @@
 """SQLite storage for scan metadata and results."""
 
 import json
+import os
 import sqlite3
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from uuid import uuid4
+from typing import Iterable, Iterator
+
+import orjson
 
 
 BASE_DIR = Path(__file__).resolve().parents[1]
@@ -12,24 +18,155 @@ DATA_DIR = BASE_DIR / 'data'
 REPORTS_DIR = DATA_DIR / 'reports'
 DB_PATH = DATA_DIR / 'feasibility.db'
 
+# Applied to every new connection. WAL lets list/get reads run alongside
+# worker writes; synchronous=NORMAL is durable enough under WAL.
+CONNECTION_PRAGMAS = (
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA cache_size=-64000',
+    'PRAGMA mmap_size=268435456',
+)
+
+READER_POOL_SIZE = 4
+
+# Columns the scan list needs; config_json stays out of list results.
+_LIST_COLUMNS = (
+    'id, created_at, status, target_url, '
+    'report_text_path, report_json_path, error_message'
+)
+
+_CROCKFORD_BASE32 = '0123456789ABCDEFGHJKMNPQRSTVWXYZ'
+_ulid_lock = threading.Lock()
+_last_ulid = 0
+
 
 def ensure_dirs() -> None:
     """Ensure data directories exist."""
-    DATA_DIR.mkdir(exist_ok=True)
-    REPORTS_DIR.mkdir(exist_ok=True)
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    REPORTS_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def get_connection() -> sqlite3.Connection:
-    """Get a DB connection."""
-    ensure_dirs()
-    conn = sqlite3.connect(DB_PATH)
+def _open_connection(path: Path, query_only: bool = False) -> sqlite3.Connection:
+    """Open a tuned autocommit connection to path."""
+    conn = sqlite3.connect(
+        path,
+        cached_statements=256,
+        isolation_level=None,
+        check_same_thread=False,
+    )
     conn.row_factory = sqlite3.Row
+    if not query_only and str(path) != ':memory:':
+        conn.execute('PRAGMA journal_mode=WAL')
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    if query_only:
+        conn.execute('PRAGMA query_only=1')
     return conn
 
 
+class ConnectionPool:
+    """One lock-guarded writer plus up to ``readers`` query-only connections.
+
+    Readers are opened on demand and reused most-recent first, so warm
+    statement caches are picked up again. An in-memory database is private
+    to its connection, so reads there go through the writer instead.
+    """
+
+    def __init__(self, path: Path, readers: int = READER_POOL_SIZE):
+        self.path = path
+        self.writer = _open_connection(path)
+        self._write_lock = threading.Lock()
+        self._read_slots = threading.BoundedSemaphore(readers)
+        self._idle_readers: list[sqlite3.Connection] = []
+        self._in_memory = str(path) == ':memory:'
+        self.pid = os.getpid()
+
+    @contextmanager
+    def write(self) -> Iterator[sqlite3.Connection]:
+        """Hold the writer; commits on success, rolls back on error."""
+        with self._write_lock, self.writer:
+            yield self.writer
+
+    @contextmanager
+    def read(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a query-only reader, waiting if all are in use."""
+        if self._in_memory:
+            with self.write() as conn:
+                yield conn
+            return
+        with self._read_slots:
+            try:
+                conn = self._idle_readers.pop()
+            except IndexError:
+                conn = _open_connection(self.path, query_only=True)
+            try:
+                yield conn
+            finally:
+                self._idle_readers.append(conn)
+
+    def close(self) -> None:
+        """Close the writer and any idle readers."""
+        while self._idle_readers:
+            self._idle_readers.pop().close()
+        self.writer.close()
+
+
+_pool: ConnectionPool | None = None
+_pool_lock = threading.Lock()
+
+
+def _pool_is_current(pool: ConnectionPool | None) -> bool:
+    """Return True if pool was opened by this process for DB_PATH."""
+    return pool is not None and pool.path == DB_PATH and pool.pid == os.getpid()
+
+
+def get_pool() -> ConnectionPool:
+    """Get the pool for DB_PATH, reopening it if the path changed.
+
+    A forked child (such as an RQ work horse) opens its own pool on first
+    use; SQLite connections must not be shared across fork. The data
+    directories are created by init_db and at worker start, not here.
+    """
+    global _pool
+    pool = _pool
+    if _pool_is_current(pool):
+        return pool
+    with _pool_lock:
+        if not _pool_is_current(_pool):
+            # Connections inherited from a parent process are left alone.
+            if _pool is not None and _pool.pid == os.getpid():
+                _pool.close()
+            _pool = ConnectionPool(DB_PATH)
+        return _pool
+
+
+@contextmanager
+def get_connection() -> Iterator[sqlite3.Connection]:
+    """Hold the shared writer connection for the duration of the block."""
+    with get_pool().write() as conn:
+        yield conn
+
+
+def _new_scan_id() -> str:
+    """Return a monotonic ULID: 48-bit ms timestamp then 80 random bits.
+
+    An ID made in the same millisecond as the previous one (or after the
+    clock steps back) is the previous value plus one, so IDs from this
+    process always sort in creation order.
+    """
+    global _last_ulid
+    with _ulid_lock:
+        value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), 'big')
+        if value <= _last_ulid:
+            value = _last_ulid + 1
+        _last_ulid = value
+    return ''.join(_CROCKFORD_BASE32[(value >> shift) & 31] for shift in range(125, -1, -5))
+
+
 def init_db() -> None:
-    """Initialize DB schema."""
-    with get_connection() as conn:
+    """Create the data directories and the DB schema."""
+    ensure_dirs()
+    with get_pool().write() as conn:
         conn.execute(
             """
             CREATE TABLE IF NOT EXISTS scans (
@@ -44,28 +181,52 @@ def init_db() -> None:
             )
             """
         )
-        conn.commit()
+
+
+_INSERT_SCAN_SQL = """
+    INSERT INTO scans (id, created_at, status, target_url, config_json)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+
+def _clock() -> str:
+    """Return the current UTC time for created_at; tests may replace it."""
+    return datetime.utcnow().isoformat() + 'Z'
+
+
+def _new_scan_row(target_url: str, config: dict) -> tuple:
+    """Build the INSERT parameters for a new queued scan."""
+    created_at = _clock()
+    try:
+        # Decoded so the column keeps TEXT affinity rather than becoming a BLOB.
+        config_json = orjson.dumps(config).decode('utf-8')
+    except orjson.JSONEncodeError:
+        # orjson rejects ints beyond 64 bits, which ScanConfig accepts.
+        config_json = json.dumps(config, separators=(',', ':'))
+    return (_new_scan_id(), created_at, 'queued', target_url, config_json)
 
 
 def create_scan(target_url: str, config: dict) -> str:
     """Insert a new scan and return its ID."""
-    scan_id = str(uuid4())
-    created_at = datetime.utcnow().isoformat() + 'Z'
-    with get_connection() as conn:
-        conn.execute(
-            """
-            INSERT INTO scans (id, created_at, status, target_url, config_json)
-            VALUES (?, ?, ?, ?, ?)
-            """,
-            (scan_id, created_at, 'queued', target_url, json.dumps(config))
-        )
+    row = _new_scan_row(target_url, config)
+    with get_pool().write() as conn:
+        conn.execute(_INSERT_SCAN_SQL, row)
+    return row[0]
+
+
+def create_scans(items: Iterable[tuple[str, dict]]) -> list[str]:
+    """Insert (target_url, config) pairs in one transaction; return their IDs."""
+    rows = [_new_scan_row(target_url, config) for target_url, config in items]
+    with get_pool().write() as conn:
+        conn.execute('BEGIN IMMEDIATE')
+        conn.executemany(_INSERT_SCAN_SQL, rows)
         conn.commit()
-    return scan_id
+    return [row[0] for row in rows]
 
 
 def update_status(scan_id: str, status: str, error_message: str = '') -> None:
     """Update scan status."""
-    with get_connection() as conn:
+    with get_pool().write() as conn:
         conn.execute(
             """
             UPDATE scans
@@ -74,12 +235,21 @@ def update_status(scan_id: str, status: str, error_message: str = '') -> None:
             """,
             (status, error_message, scan_id)
         )
-        conn.commit()
+
+
+_FAIL_SQL = "UPDATE scans SET status = 'failed', error_message = ? WHERE id = ?"
+ERROR_MESSAGE_MAX_LEN = 200
+
+
+def fail_scan(scan_id: str, error_message: str) -> None:
+    """Mark a scan failed, keeping at most ERROR_MESSAGE_MAX_LEN characters."""
+    with get_pool().write() as conn:
+        conn.execute(_FAIL_SQL, (error_message[:ERROR_MESSAGE_MAX_LEN], scan_id))
 
 
 def attach_results(scan_id: str, report_text_path: str, report_json_path: str) -> None:
     """Attach report file paths."""
-    with get_connection() as conn:
+    with get_pool().write() as conn:
         conn.execute(
             """
             UPDATE scans
@@ -88,26 +258,45 @@ def attach_results(scan_id: str, report_text_path: str, report_json_path: str) -
             """,
             (report_text_path, report_json_path, scan_id)
         )
+
+
+def finalize_scan(scan_id: str, report_text_path: str, report_json_path: str) -> None:
+    """Attach report paths and mark a scan finished in one transaction."""
+    with get_pool().write() as conn:
+        conn.execute('BEGIN IMMEDIATE')
+        conn.execute(
+            """
+            UPDATE scans
+            SET report_text_path = ?, report_json_path = ?, status = 'finished'
+            WHERE id = ?
+            """,
+            (report_text_path, report_json_path, scan_id)
+        )
         conn.commit()
 
 
 def get_scan(scan_id: str) -> dict | None:
     """Fetch scan by ID."""
-    with get_connection() as conn:
+    with get_pool().read() as conn:
         row = conn.execute(
             "SELECT * FROM scans WHERE id = ?",
             (scan_id,)
         ).fetchone()
-        if not row:
-            return None
-        return dict(row)
+        return dict(row) if row else None
 
 
 def list_scans(limit: int = 50) -> list:
-    """List recent scans."""
-    with get_connection() as conn:
-        rows = conn.execute(
-            "SELECT * FROM scans ORDER BY created_at DESC LIMIT ?",
+    """List recent scans, newest first, without their config."""
+    with get_pool().read() as conn:
+        # Plain tuples zipped with the column names once per query are
+        # cheaper than building each dict through sqlite3.Row.keys().
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        cursor.execute(
+            # rowid follows insertion order, so this walks the table
+            # backwards instead of sorting every row by created_at.
+            f"SELECT {_LIST_COLUMNS} FROM scans ORDER BY rowid DESC LIMIT ?",
             (limit,)
-        ).fetchall()
-        return [dict(r) for r in rows]
+        )
+        columns = [description[0] for description in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
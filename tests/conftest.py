@@ -24,7 +24,11 @@ def temp_db():
 
 @pytest.fixture
 def temp_data_dir(tmp_path):
-    """Create a temporary data directory structure."""
+    """Create a temporary data directory structure.
+
+    Built on tmp_path, so every test (and every pytest-xdist worker) gets
+    its own DB_PATH, DATA_DIR and REPORTS_DIR.
+    """
     data_dir = tmp_path / 'data'
     reports_dir = data_dir / 'reports'
     data_dir.mkdir()
@@ -104,15 +108,15 @@ def authenticated_session(mock_session):
 def sample_element_analysis():
     """Create a sample ElementAnalysis object."""
     from pendo_feasibility_scraper import ElementAnalysis
-    analysis = ElementAnalysis()
-    analysis.total = 10
-    analysis.stable_ids = 5
-    analysis.dynamic_ids = 2
-    analysis.no_ids = 3
-    analysis.has_pendo_attr = 1
-    analysis.has_data_attr = 4
-    analysis.has_text_content = 8
-    return analysis
+    return ElementAnalysis(
+        total=10,
+        stable_ids=5,
+        dynamic_ids=2,
+        no_ids=3,
+        has_pendo_attr=1,
+        has_data_attr=4,
+        has_text_content=8,
+    )
 
 
 @pytest.fixture
@@ -120,38 +124,37 @@ def sample_page_analysis():
     """Create a sample PageAnalysis object."""
     from pendo_feasibility_scraper import PageAnalysis, ElementAnalysis
 
-    buttons = ElementAnalysis()
-    buttons.total = 5
-    buttons.stable_ids = 3
-    buttons.dynamic_ids = 1
-    buttons.no_ids = 1
-
-    inputs = ElementAnalysis()
-    inputs.total = 3
-    inputs.stable_ids = 2
-    inputs.dynamic_ids = 0
-    inputs.no_ids = 1
+    return PageAnalysis(
+        url='https://example.com/page1',
+        buttons=ElementAnalysis(total=5, stable_ids=3, dynamic_ids=1, no_ids=1),
+        inputs=ElementAnalysis(total=3, stable_ids=2, dynamic_ids=0, no_ids=1),
+        links=ElementAnalysis(total=10, stable_ids=5),
+        dynamic_class_count=5,
+        dynamic_class_examples=[('btn-abc123', 'Dynamic hash suffix')],
+    )
 
-    links = ElementAnalysis()
-    links.total = 10
-    links.stable_ids = 5
 
-    analysis = PageAnalysis(url='https://example.com/page1')
-    analysis.buttons = buttons
-    analysis.inputs = inputs
-    analysis.links = links
-    analysis.dynamic_class_count = 5
-    analysis.dynamic_class_examples = [('btn-abc123', 'Dynamic hash suffix')]
-
-    return analysis
+def _software_detection():
+    """Build the SoftwareDetection both fixtures below return."""
+    from pendo_feasibility_scraper import SoftwareDetection
+    return SoftwareDetection(
+        frontend_frameworks=['React', 'Next.js'],
+        css_frameworks=['Material UI'],
+        analytics_tools=['Segment', 'Heap'],
+    )
 
 
 @pytest.fixture
 def sample_software_detection():
     """Create a sample SoftwareDetection object."""
-    from pendo_feasibility_scraper import SoftwareDetection
-    detection = SoftwareDetection()
-    detection.frontend_frameworks = ['React', 'Next.js']
-    detection.css_frameworks = ['Material UI']
-    detection.analytics_tools = ['Segment', 'Heap']
-    return detection
+    return _software_detection()
+
+
+@pytest.fixture(scope='session')
+def simple_software_detection():
+    """Create simple software detection shared by the whole run.
+
+    Session-scoped, so treat it as read-only; tests that need to vary it
+    should use dataclasses.replace() or sample_software_detection.
+    """
+    return _software_detection()
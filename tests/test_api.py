@@ -10,10 +10,12 @@ server stack is installed.
 
 import json
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 
+from server.storage import init_db, create_scan, attach_results, update_status
+
 # Check if server dependencies are available at module level
 # Use a simple check that doesn't cause import errors
 def _check_server_available():
@@ -42,23 +44,32 @@ def mock_queue():
     return mock
 
 
-@pytest.fixture
-def app_client(mock_storage_paths, mock_queue):
-    """Create a test client with mocked dependencies."""
+@pytest.fixture(scope='module')
+def shared_client():
+    """One TestClient reused by every test in this module.
+
+    The client is deliberately not entered as a context manager, so the
+    app's startup hook never runs against the real data directory. Each
+    fixture below patches the storage paths and calls init_db() itself.
+    """
     pytest.importorskip("fastapi")
     pytest.importorskip("authlib")
 
     from fastapi.testclient import TestClient
+    from server.app import app
 
-    with patch('server.storage.DATA_DIR', mock_storage_paths['data_dir']), \
-         patch('server.storage.REPORTS_DIR', mock_storage_paths['reports_dir']), \
-         patch('server.storage.DB_PATH', mock_storage_paths['db_path']), \
-         patch('server.queue.get_queue', return_value=mock_queue):
-        from server.app import app
-        from server.storage import init_db
-        init_db()
-        with TestClient(app) as client:
-            yield client
+    client = TestClient(app)
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def app_client(mock_storage_paths, mock_queue, shared_client, monkeypatch):
+    """Create a test client with mocked dependencies."""
+    monkeypatch.setattr('server.queue.get_queue', lambda: mock_queue)
+    init_db()
+    shared_client.cookies.clear()
+    return shared_client
 
 
 class TestHealthEndpoint:
@@ -93,30 +104,15 @@ class TestAuthEndpoints:
 class TestScanEndpoints:
     """Tests for scan-related endpoints."""
 
-    def test_create_scan_requires_auth(self, app_client):
-        """POST /api/scans should require authentication."""
-        response = app_client.post(
-            '/api/scans',
-            json={'target_url': 'https://example.com', 'config': {}}
-        )
-
-        assert response.status_code == 401
-
-    def test_list_scans_requires_auth(self, app_client):
-        """GET /api/scans should require authentication."""
-        response = app_client.get('/api/scans')
-
-        assert response.status_code == 401
-
-    def test_get_scan_requires_auth(self, app_client):
-        """GET /api/scans/{id} should require authentication."""
-        response = app_client.get('/api/scans/some-scan-id')
-
-        assert response.status_code == 401
-
-    def test_get_scan_report_requires_auth(self, app_client):
-        """GET /api/scans/{id}/report should require authentication."""
-        response = app_client.get('/api/scans/some-scan-id/report')
+    @pytest.mark.parametrize('method,path,payload', [
+        ('POST', '/api/scans', {'target_url': 'https://example.com', 'config': {}}),
+        ('GET', '/api/scans', None),
+        ('GET', '/api/scans/some-scan-id', None),
+        ('GET', '/api/scans/some-scan-id/report', None),
+    ])
+    def test_scan_endpoints_require_auth(self, app_client, method, path, payload):
+        """Scan endpoints should return 401 without an authenticated session."""
+        response = app_client.request(method, path, json=payload)
 
         assert response.status_code == 401
 
@@ -125,21 +121,13 @@ class TestScanCreation:
     """Tests for scan creation with authentication."""
 
     @pytest.fixture
-    def auth_client_with_mocks(self, mock_storage_paths, mock_queue):
+    def auth_client_with_mocks(self, mock_storage_paths, mock_queue, shared_client, monkeypatch):
         """Create authenticated client with all mocks."""
-        pytest.importorskip("authlib")
-        from fastapi.testclient import TestClient
-
-        with patch('server.storage.DATA_DIR', mock_storage_paths['data_dir']), \
-             patch('server.storage.REPORTS_DIR', mock_storage_paths['reports_dir']), \
-             patch('server.storage.DB_PATH', mock_storage_paths['db_path']), \
-             patch('server.queue.get_queue', return_value=mock_queue), \
-             patch('server.app.get_current_user', return_value={'email': 'test@pendo.io'}):
-            from server.app import app
-            from server.storage import init_db
-            init_db()
-            with TestClient(app) as client:
-                yield client, mock_queue
+        monkeypatch.setattr('server.queue.get_queue', lambda: mock_queue)
+        monkeypatch.setattr('server.app.get_current_user', lambda request: {'email': 'test@pendo.io'})
+        init_db()
+        shared_client.cookies.clear()
+        return shared_client, mock_queue
 
     def test_create_scan_valid_request(self, auth_client_with_mocks):
         """Valid scan request should succeed."""
@@ -204,24 +192,15 @@ class TestScanRetrieval:
     """Tests for retrieving scans."""
 
     @pytest.fixture
-    def auth_client_with_scan(self, mock_storage_paths, mock_queue):
+    def auth_client_with_scan(self, mock_storage_paths, mock_queue, shared_client, monkeypatch):
         """Create authenticated client with a pre-existing scan."""
-        pytest.importorskip("authlib")
-        from fastapi.testclient import TestClient
-
-        with patch('server.storage.DATA_DIR', mock_storage_paths['data_dir']), \
-             patch('server.storage.REPORTS_DIR', mock_storage_paths['reports_dir']), \
-             patch('server.storage.DB_PATH', mock_storage_paths['db_path']), \
-             patch('server.queue.get_queue', return_value=mock_queue), \
-             patch('server.app.get_current_user', return_value={'email': 'test@pendo.io'}):
-            from server.app import app
-            from server.storage import init_db, create_scan
-
-            init_db()
-            scan_id = create_scan('https://example.com', {'max_pages': 5})
+        monkeypatch.setattr('server.queue.get_queue', lambda: mock_queue)
+        monkeypatch.setattr('server.app.get_current_user', lambda request: {'email': 'test@pendo.io'})
+        init_db()
+        scan_id = create_scan('https://example.com', {'max_pages': 5})
 
-            with TestClient(app) as client:
-                yield client, scan_id
+        shared_client.cookies.clear()
+        return shared_client, scan_id
 
     def test_list_scans_returns_list(self, auth_client_with_scan):
         """GET /api/scans should return a list."""
@@ -259,25 +238,25 @@ class TestScanRetrieval:
 class TestScanReports:
     """Tests for scan report retrieval."""
 
-    @pytest.fixture
-    def auth_client_with_reports(self, mock_storage_paths, mock_queue):
-        """Create authenticated client with scan that has reports."""
-        pytest.importorskip("authlib")
-        from fastapi.testclient import TestClient
-
-        with patch('server.storage.DATA_DIR', mock_storage_paths['data_dir']), \
-             patch('server.storage.REPORTS_DIR', mock_storage_paths['reports_dir']), \
-             patch('server.storage.DB_PATH', mock_storage_paths['db_path']), \
-             patch('server.queue.get_queue', return_value=mock_queue), \
-             patch('server.app.get_current_user', return_value={'email': 'test@pendo.io'}):
-            from server.app import app
-            from server.storage import init_db, create_scan, attach_results, update_status
-
+    @pytest.fixture(scope='class')
+    def stored_reports(self, tmp_path_factory):
+        """Create one finished scan with report files for the whole class.
+
+        The report tests only read the scan and its files, so they share
+        the same database, scan ID and report files. Returns the scan ID.
+        """
+        data_dir = tmp_path_factory.mktemp('reports_shared')
+        reports_dir = data_dir / 'reports'
+        reports_dir.mkdir()
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr('server.storage.DATA_DIR', data_dir)
+            mp.setattr('server.storage.REPORTS_DIR', reports_dir)
+            mp.setattr('server.storage.DB_PATH', data_dir / 'feasibility.db')
             init_db()
             scan_id = create_scan('https://example.com', {'max_pages': 5})
 
             # Create report files
-            reports_dir = mock_storage_paths['reports_dir']
             text_path = reports_dir / f'{scan_id}.txt'
             json_path = reports_dir / f'{scan_id}.json'
 
@@ -287,8 +266,15 @@ class TestScanReports:
             attach_results(scan_id, str(text_path), str(json_path))
             update_status(scan_id, 'finished')
 
-            with TestClient(app) as client:
-                yield client, scan_id
+            yield scan_id
+
+    @pytest.fixture
+    def auth_client_with_reports(self, stored_reports, mock_queue, shared_client, monkeypatch):
+        """Create authenticated client with scan that has reports."""
+        monkeypatch.setattr('server.queue.get_queue', lambda: mock_queue)
+        monkeypatch.setattr('server.app.get_current_user', lambda request: {'email': 'test@pendo.io'})
+        shared_client.cookies.clear()
+        return shared_client, stored_reports
 
     def test_get_text_report(self, auth_client_with_reports):
         """GET /api/scans/{id}/report should return text report."""
@@ -310,46 +296,63 @@ class TestScanReports:
         assert response.json() == {'test': 'data'}
         assert 'application/json' in response.headers['content-type']
 
-    def test_get_report_not_ready(self, mock_storage_paths, mock_queue):
+    def test_get_report_not_ready(self, mock_storage_paths, mock_queue, shared_client, monkeypatch):
         """Report endpoints should return 404 if report not ready."""
-        pytest.importorskip("authlib")
-        from fastapi.testclient import TestClient
+        monkeypatch.setattr('server.queue.get_queue', lambda: mock_queue)
+        monkeypatch.setattr('server.app.get_current_user', lambda request: {'email': 'test@pendo.io'})
+        init_db()
+        scan_id = create_scan('https://example.com', {})
 
-        with patch('server.storage.DATA_DIR', mock_storage_paths['data_dir']), \
-             patch('server.storage.REPORTS_DIR', mock_storage_paths['reports_dir']), \
-             patch('server.storage.DB_PATH', mock_storage_paths['db_path']), \
-             patch('server.queue.get_queue', return_value=mock_queue), \
-             patch('server.app.get_current_user', return_value={'email': 'test@pendo.io'}):
-            from server.app import app
-            from server.storage import init_db, create_scan
+        shared_client.cookies.clear()
+        response = shared_client.get(f'/api/scans/{scan_id}/report')
+        assert response.status_code == 404
 
-            init_db()
-            scan_id = create_scan('https://example.com', {})
+    @pytest.mark.parametrize('accept_encoding, content_encoding', [
+        ('identity', None),
+        ('zstd', 'zstd'),
+        ('gzip, ZSTD;q=0.5', 'zstd'),
+        ('gzip, zstd;q=0', None),
+        ('*', None),
+    ])
+    def test_get_compressed_json_report(
+        self, mock_storage_paths, mock_queue, shared_client, monkeypatch,
+        accept_encoding, content_encoding,
+    ):
+        """A zstd-compressed JSON report should be served as JSON either way."""
+        zstandard = pytest.importorskip('zstandard')
+        monkeypatch.setattr('server.queue.get_queue', lambda: mock_queue)
+        monkeypatch.setattr('server.app.get_current_user', lambda request: {'email': 'test@pendo.io'})
+        init_db()
+        scan_id = create_scan('https://example.com', {})
+        reports_dir = mock_storage_paths['reports_dir']
+        text_path = reports_dir / f'{scan_id}.txt'
+        json_path = reports_dir / f'{scan_id}.json.zst'
+        text_path.write_text('Test report content')
+        json_path.write_bytes(zstandard.ZstdCompressor().compress(b'{"test": "data"}'))
+        attach_results(scan_id, str(text_path), str(json_path))
+
+        shared_client.cookies.clear()
+        response = shared_client.get(
+            f'/api/scans/{scan_id}/report.json',
+            headers={'Accept-Encoding': accept_encoding},
+        )
 
-            with TestClient(app) as client:
-                response = client.get(f'/api/scans/{scan_id}/report')
-                assert response.status_code == 404
+        assert response.status_code == 200
+        assert response.json() == {'test': 'data'}
+        assert response.headers.get('content-encoding') == content_encoding
 
 
 class TestInputValidation:
     """Tests for API input validation."""
 
     @pytest.fixture
-    def auth_client(self, mock_storage_paths, mock_queue):
+    def auth_client(self, mock_storage_paths, mock_queue, shared_client, monkeypatch):
         """Create authenticated client for validation tests."""
-        pytest.importorskip("authlib")
-        from fastapi.testclient import TestClient
-
-        with patch('server.storage.DATA_DIR', mock_storage_paths['data_dir']), \
-             patch('server.storage.REPORTS_DIR', mock_storage_paths['reports_dir']), \
-             patch('server.storage.DB_PATH', mock_storage_paths['db_path']), \
-             patch('server.queue.get_queue', return_value=mock_queue), \
-             patch('server.app.get_current_user', return_value={'email': 'test@pendo.io'}):
-            from server.app import app
-            from server.storage import init_db
-            init_db()
-            with TestClient(app) as client:
-                yield client
+        monkeypatch.setattr('server.queue.get_queue', lambda: mock_queue)
+        monkeypatch.setattr('server.app.get_current_user', lambda request: {'email': 'test@pendo.io'})
+        init_db()
+        shared_client.cookies.clear()
+        return shared_client
 
     def test_create_scan_missing_url(self, auth_client):
         """Create scan without URL should fail validation."""
@@ -4,12 +4,16 @@ These functions are core to the application's value proposition -
 detecting problematic patterns that will break Pendo tags.
 """
 
+import random
+
 import pytest
 from pendo_feasibility_scraper import (
     check_dynamic_id,
     check_dynamic_class,
     DYNAMIC_ID_PATTERNS,
     DYNAMIC_CLASS_PATTERNS,
+    DYNAMIC_ID_LABELS,
+    DYNAMIC_CLASS_LABELS,
 )
 
 
@@ -33,56 +37,52 @@ class TestCheckDynamicId:
 
     # --- Stable IDs (should NOT be flagged) ---
 
-    def test_simple_stable_id(self):
+    @pytest.mark.parametrize('id_value', [
+        'submit-button',
+        'login-form',
+        'main-content',
+        'nav-bar',
+        'header',
+        'footer',
+        'sidebar',
+        'search-input',
+        'user-profile',
+    ])
+    def test_simple_stable_id(self, id_value):
         """Simple descriptive IDs should not be flagged."""
-        stable_ids = [
-            'submit-button',
-            'login-form',
-            'main-content',
-            'nav-bar',
-            'header',
-            'footer',
-            'sidebar',
-            'search-input',
-            'user-profile',
-        ]
-        for id_value in stable_ids:
-            is_dynamic, label, reason, has_prefix = check_dynamic_id(id_value)
-            assert is_dynamic is False, f'ID "{id_value}" should not be flagged as dynamic'
-
-    def test_stable_id_with_numbers(self):
+        is_dynamic, label, reason, has_prefix = check_dynamic_id(id_value)
+        assert is_dynamic is False, f'ID "{id_value}" should not be flagged as dynamic'
+
+    @pytest.mark.parametrize('id_value', [
+        'step-1',
+        'item-2',
+        'page-10',
+        'section-3-header',
+    ])
+    def test_stable_id_with_numbers(self, id_value):
         """IDs with meaningful numbers should not be flagged."""
-        stable_ids = [
-            'step-1',
-            'item-2',
-            'page-10',
-            'section-3-header',
-        ]
-        for id_value in stable_ids:
-            is_dynamic, label, reason, has_prefix = check_dynamic_id(id_value)
-            assert is_dynamic is False, f'ID "{id_value}" should not be flagged as dynamic'
+        is_dynamic, label, reason, has_prefix = check_dynamic_id(id_value)
+        assert is_dynamic is False, f'ID "{id_value}" should not be flagged as dynamic'
 
     # --- Ember.js patterns ---
 
-    def test_ember_runtime_id(self):
+    @pytest.mark.parametrize('id_value', ['ember123', 'ember456', 'ember1', 'ember99999'])
+    def test_ember_runtime_id(self, id_value):
         """Ember runtime IDs should be flagged (no stable prefix)."""
-        ember_ids = ['ember123', 'ember456', 'ember1', 'ember99999']
-        for id_value in ember_ids:
-            is_dynamic, label, reason, has_prefix = check_dynamic_id(id_value)
-            assert is_dynamic is True, f'Ember ID "{id_value}" should be flagged'
-            assert label == 'ember*'
-            assert has_prefix is False  # No stable prefix workaround
+        is_dynamic, label, reason, has_prefix = check_dynamic_id(id_value)
+        assert is_dynamic is True, f'Ember ID "{id_value}" should be flagged'
+        assert label == 'ember*'
+        assert has_prefix is False  # No stable prefix workaround
 
     # --- Radix UI patterns ---
 
-    def test_radix_runtime_id(self):
+    @pytest.mark.parametrize('id_value', [':r1:', ':ra:', ':r1ab:'])
+    def test_radix_runtime_id(self, id_value):
         """Radix UI runtime IDs should be flagged (no stable prefix)."""
-        radix_ids = [':r1:', ':ra:', ':r1ab:']
-        for id_value in radix_ids:
-            is_dynamic, label, reason, has_prefix = check_dynamic_id(id_value)
-            assert is_dynamic is True, f'Radix ID "{id_value}" should be flagged'
-            assert label == 'radix-:r*:'
-            assert has_prefix is False
+        is_dynamic, label, reason, has_prefix = check_dynamic_id(id_value)
+        assert is_dynamic is True, f'Radix ID "{id_value}" should be flagged'
+        assert label == 'radix-:r*:'
+        assert has_prefix is False
 
     def test_radix_component_id_has_prefix(self):
         """Radix component IDs have stable prefixes."""
@@ -92,186 +92,171 @@ class TestCheckDynamicId:
 
     # --- Numeric-only IDs ---
 
-    def test_numeric_only_id(self):
+    @pytest.mark.parametrize('id_value', ['123', '1', '99999', '000001'])
+    def test_numeric_only_id(self, id_value):
         """Pure numeric IDs (database records) should be flagged."""
-        numeric_ids = ['123', '1', '99999', '000001']
-        for id_value in numeric_ids:
-            is_dynamic, label, reason, has_prefix = check_dynamic_id(id_value)
-            assert is_dynamic is True, f'Numeric ID "{id_value}" should be flagged'
-            assert label == 'numeric-only'
-            assert has_prefix is False
+        is_dynamic, label, reason, has_prefix = check_dynamic_id(id_value)
+        assert is_dynamic is True, f'Numeric ID "{id_value}" should be flagged'
+        assert label == 'numeric-only'
+        assert has_prefix is False
 
     # --- React Select patterns ---
 
-    def test_react_select_id(self):
+    @pytest.mark.parametrize('id_value', [
+        'react-select-1-input',
+        'react-select-2-listbox',
+        'react-select-123-option-0',
+    ])
+    def test_react_select_id(self, id_value):
         """React Select IDs should be flagged with prefix workaround."""
-        react_select_ids = [
-            'react-select-1-input',
-            'react-select-2-listbox',
-            'react-select-123-option-0',
-        ]
-        for id_value in react_select_ids:
-            is_dynamic, label, reason, has_prefix = check_dynamic_id(id_value)
-            assert is_dynamic is True, f'React Select ID "{id_value}" should be flagged'
-            assert label == 'react-select-*'
-            assert has_prefix is True
+        is_dynamic, label, reason, has_prefix = check_dynamic_id(id_value)
+        assert is_dynamic is True, f'React Select ID "{id_value}" should be flagged'
+        assert label == 'react-select-*'
+        assert has_prefix is True
 
     # --- Material UI patterns ---
 
-    def test_mui_id(self):
+    @pytest.mark.parametrize('id_value', ['mui-1', 'mui-123', 'mui-99999'])
+    def test_mui_id(self, id_value):
         """Material UI IDs should be flagged with prefix workaround."""
         # Pattern is ^mui-\d+ so IDs must start with mui- followed by digits
-        mui_ids = ['mui-1', 'mui-123', 'mui-99999']
-        for id_value in mui_ids:
-            is_dynamic, label, reason, has_prefix = check_dynamic_id(id_value)
-            assert is_dynamic is True, f'MUI ID "{id_value}" should be flagged'
-            assert label == 'mui-*'
-            assert has_prefix is True
+        is_dynamic, label, reason, has_prefix = check_dynamic_id(id_value)
+        assert is_dynamic is True, f'MUI ID "{id_value}" should be flagged'
+        assert label == 'mui-*'
+        assert has_prefix is True
 
     # --- Headless UI patterns ---
 
-    def test_headlessui_id(self):
+    @pytest.mark.parametrize('id_value', ['headlessui-menu-button-1', 'headlessui-listbox-option-2'])
+    def test_headlessui_id(self, id_value):
         """Headless UI IDs should be flagged with prefix workaround."""
-        ids = ['headlessui-menu-button-1', 'headlessui-listbox-option-2']
-        for id_value in ids:
-            is_dynamic, label, reason, has_prefix = check_dynamic_id(id_value)
-            assert is_dynamic is True
-            assert label == 'headlessui-*'
-            assert has_prefix is True
+        is_dynamic, label, reason, has_prefix = check_dynamic_id(id_value)
+        assert is_dynamic is True
+        assert label == 'headlessui-*'
+        assert has_prefix is True
 
     # --- Chakra UI patterns ---
 
-    def test_chakra_id(self):
+    @pytest.mark.parametrize('id_value', ['chakra-modal-1', 'chakra-popover-trigger-2'])
+    def test_chakra_id(self, id_value):
         """Chakra UI IDs should be flagged with prefix workaround."""
-        ids = ['chakra-modal-1', 'chakra-popover-trigger-2']
-        for id_value in ids:
-            is_dynamic, label, reason, has_prefix = check_dynamic_id(id_value)
-            assert is_dynamic is True
-            assert label == 'chakra-*'
-            assert has_prefix is True
+        is_dynamic, label, reason, has_prefix = check_dynamic_id(id_value)
+        assert is_dynamic is True
+        assert label == 'chakra-*'
+        assert has_prefix is True
 
     # --- Mantine patterns ---
 
-    def test_mantine_id(self):
+    @pytest.mark.parametrize('id_value', ['mantine-modal-1', 'mantine-select-dropdown-2'])
+    def test_mantine_id(self, id_value):
         """Mantine UI IDs should be flagged with prefix workaround."""
-        ids = ['mantine-modal-1', 'mantine-select-dropdown-2']
-        for id_value in ids:
-            is_dynamic, label, reason, has_prefix = check_dynamic_id(id_value)
-            assert is_dynamic is True
-            assert label == 'mantine-*'
-            assert has_prefix is True
+        is_dynamic, label, reason, has_prefix = check_dynamic_id(id_value)
+        assert is_dynamic is True
+        assert label == 'mantine-*'
+        assert has_prefix is True
 
     # --- Downshift patterns ---
 
-    def test_downshift_id(self):
+    @pytest.mark.parametrize('id_value', ['downshift-1-item-0', 'downshift-2-menu'])
+    def test_downshift_id(self, id_value):
         """Downshift IDs should be flagged with prefix workaround."""
-        ids = ['downshift-1-item-0', 'downshift-2-menu']
-        for id_value in ids:
-            is_dynamic, label, reason, has_prefix = check_dynamic_id(id_value)
-            assert is_dynamic is True
-            assert label == 'downshift-*'
-            assert has_prefix is True
+        is_dynamic, label, reason, has_prefix = check_dynamic_id(id_value)
+        assert is_dynamic is True
+        assert label == 'downshift-*'
+        assert has_prefix is True
 
     # --- Angular patterns ---
 
-    def test_angular_compiler_id(self):
+    @pytest.mark.parametrize('id_value', ['ng-c1', 'ng-c123', 'ng-c9999'])
+    def test_angular_compiler_id(self, id_value):
         """Angular compiler IDs should be flagged (no stable prefix)."""
-        ids = ['ng-c1', 'ng-c123', 'ng-c9999']
-        for id_value in ids:
-            is_dynamic, label, reason, has_prefix = check_dynamic_id(id_value)
-            assert is_dynamic is True
-            assert label == 'ng-c*'
-            assert has_prefix is False
-
-    def test_angular_cdk_id(self):
+        is_dynamic, label, reason, has_prefix = check_dynamic_id(id_value)
+        assert is_dynamic is True
+        assert label == 'ng-c*'
+        assert has_prefix is False
+
+    @pytest.mark.parametrize('id_value', ['cdk-a-1', 'cdk-overlay-123', 'cdk-drag-99'])
+    def test_angular_cdk_id(self, id_value):
         """Angular CDK IDs should be flagged with prefix workaround."""
         # Pattern is ^cdk-[a-z]+-\d+ so need letters, then dash, then digits
-        ids = ['cdk-a-1', 'cdk-overlay-123', 'cdk-drag-99']
-        for id_value in ids:
-            is_dynamic, label, reason, has_prefix = check_dynamic_id(id_value)
-            assert is_dynamic is True, f'CDK ID "{id_value}" should be flagged'
-            assert label == 'cdk-*'
-            assert has_prefix is True
-
-    def test_angular_material_id(self):
+        is_dynamic, label, reason, has_prefix = check_dynamic_id(id_value)
+        assert is_dynamic is True, f'CDK ID "{id_value}" should be flagged'
+        assert label == 'cdk-*'
+        assert has_prefix is True
+
+    @pytest.mark.parametrize('id_value', ['mat-select-1', 'mat-input-2'])
+    def test_angular_material_id(self, id_value):
         """Angular Material IDs should be flagged with prefix workaround."""
-        ids = ['mat-select-1', 'mat-input-2']
-        for id_value in ids:
-            is_dynamic, label, reason, has_prefix = check_dynamic_id(id_value)
-            assert is_dynamic is True
-            assert label == 'mat-*'
-            assert has_prefix is True
+        is_dynamic, label, reason, has_prefix = check_dynamic_id(id_value)
+        assert is_dynamic is True
+        assert label == 'mat-*'
+        assert has_prefix is True
 
     # --- UUID patterns ---
 
-    def test_uuid_id(self):
+    @pytest.mark.parametrize('id_value', [
+        'a1b2c3d4-e5f6-7890-abcd-ef1234567890',
+        '12345678-abcd-ef12-3456-789012345678',
+    ])
+    def test_uuid_id(self, id_value):
         """UUID IDs should be flagged (no stable prefix)."""
-        ids = [
-            'a1b2c3d4-e5f6-7890-abcd-ef1234567890',
-            '12345678-abcd-ef12-3456-789012345678',
-        ]
-        for id_value in ids:
-            is_dynamic, label, reason, has_prefix = check_dynamic_id(id_value)
-            assert is_dynamic is True
-            assert label == 'uuid-*'
-            assert has_prefix is False
+        is_dynamic, label, reason, has_prefix = check_dynamic_id(id_value)
+        assert is_dynamic is True
+        assert label == 'uuid-*'
+        assert has_prefix is False
 
     # --- Hash-based patterns ---
 
-    def test_pure_hash_id(self):
+    @pytest.mark.parametrize('id_value', ['a1b2c3d4e5f6', 'abcdef123456', '1234567890abcdef'])
+    def test_pure_hash_id(self, id_value):
         """Pure hash IDs should be flagged (no stable prefix)."""
-        ids = ['a1b2c3d4e5f6', 'abcdef123456', '1234567890abcdef']
-        for id_value in ids:
-            is_dynamic, label, reason, has_prefix = check_dynamic_id(id_value)
-            assert is_dynamic is True
-            assert label == 'hash-only'
-            assert has_prefix is False
-
-    def test_minified_id(self):
+        is_dynamic, label, reason, has_prefix = check_dynamic_id(id_value)
+        assert is_dynamic is True
+        assert label == 'hash-only'
+        assert has_prefix is False
+
+    @pytest.mark.parametrize('id_value', ['a12345', 'ab99999', 'x123456'])
+    def test_minified_id(self, id_value):
         """Minified IDs should be flagged (no stable prefix)."""
-        ids = ['a12345', 'ab99999', 'x123456']
-        for id_value in ids:
-            is_dynamic, label, reason, has_prefix = check_dynamic_id(id_value)
-            assert is_dynamic is True
-            assert label == 'minified'
-            assert has_prefix is False
+        is_dynamic, label, reason, has_prefix = check_dynamic_id(id_value)
+        assert is_dynamic is True
+        assert label == 'minified'
+        assert has_prefix is False
 
     # --- Hash suffix patterns ---
 
-    def test_hash_suffix_id(self):
+    @pytest.mark.parametrize('id_value', ['button-a1b2c3d4e', 'nav-item-abcdef'])
+    def test_hash_suffix_id(self, id_value):
         """IDs with hash suffixes should be flagged with prefix workaround."""
-        ids = ['button-a1b2c3d4e', 'nav-item-abcdef']
-        for id_value in ids:
-            is_dynamic, label, reason, has_prefix = check_dynamic_id(id_value)
-            assert is_dynamic is True
-            assert label == '*-hash'
-            assert has_prefix is True
-
-    def test_css_modules_hash_suffix(self):
+        is_dynamic, label, reason, has_prefix = check_dynamic_id(id_value)
+        assert is_dynamic is True
+        assert label == '*-hash'
+        assert has_prefix is True
+
+    @pytest.mark.parametrize('id_value', ['nav-bar__2RnO8abc', 'button__xyz12345'])
+    def test_css_modules_hash_suffix(self, id_value):
         """CSS Modules hash suffixes should be flagged with prefix workaround."""
-        ids = ['nav-bar__2RnO8abc', 'button__xyz12345']
-        for id_value in ids:
-            is_dynamic, label, reason, has_prefix = check_dynamic_id(id_value)
-            assert is_dynamic is True
-            assert label == '*__hash'
-            assert has_prefix is True
+        is_dynamic, label, reason, has_prefix = check_dynamic_id(id_value)
+        assert is_dynamic is True
+        assert label == '*__hash'
+        assert has_prefix is True
 
     # --- CSS-in-JS patterns ---
 
-    def test_css_in_js_id(self):
+    @pytest.mark.parametrize('id_value,expected_label', [
+        ('sc-abcdef', '*-hash'),
+        ('css-1abc2de', '*-hash'),
+        ('emotion-xyz123', 'css-in-js'),
+        ('styled-abc123', '*-hash'),
+    ])
+    def test_css_in_js_id(self, id_value, expected_label):
         """CSS-in-JS generated IDs should be flagged."""
         # Pattern: ^(sc|css|emotion|styled)-[a-zA-Z0-9]+$
-        # These must exactly match the pattern without matching earlier patterns
-        css_in_js_ids = [
-            ('sc-abcdef', 'css-in-js'),
-            ('css-1abc2de', 'css-in-js'),
-            ('emotion-xyz123', 'css-in-js'),
-            ('styled-abc123', 'css-in-js'),
-        ]
-        for id_value, expected_label in css_in_js_ids:
-            is_dynamic, label, reason, has_prefix = check_dynamic_id(id_value)
-            assert is_dynamic is True, f'CSS-in-JS ID "{id_value}" should be flagged'
-            assert has_prefix is True
+        # The earlier *-hash pattern claims any of these with a hex-like suffix
+        is_dynamic, label, reason, has_prefix = check_dynamic_id(id_value)
+        assert is_dynamic is True, f'CSS-in-JS ID "{id_value}" should be flagged'
+        assert label == expected_label
+        assert has_prefix is True
 
 
 class TestCheckDynamicClass:
@@ -294,158 +279,161 @@ class TestCheckDynamicClass:
 
     # --- Stable classes (should NOT be flagged) ---
 
-    def test_simple_stable_class(self):
+    @pytest.mark.parametrize('class_name', [
+        'btn',
+        'btn-primary',
+        'nav-item',
+        'card-header',
+        'card-body--large',
+        'text-center',
+        'flex',
+        'hidden',
+        'container',
+        'card__hdr',  # Too short to match CSS Modules pattern
+    ])
+    def test_simple_stable_class(self, class_name):
         """Simple BEM-style classes should not be flagged."""
         # Note: Classes with __ followed by 5+ alphanumeric chars match CSS Modules pattern
         # So we avoid those patterns here
-        stable_classes = [
-            'btn',
-            'btn-primary',
-            'nav-item',
-            'card-header',
-            'card-body--large',
-            'text-center',
-            'flex',
-            'hidden',
-            'container',
-            'card__hdr',  # Too short to match CSS Modules pattern
-        ]
-        for class_name in stable_classes:
-            is_dynamic, label, reason, stable_prefix = check_dynamic_class(class_name)
-            assert is_dynamic is False, f'Class "{class_name}" should not be flagged'
-
-    def test_tailwind_classes_stable(self):
+        is_dynamic, label, reason, stable_prefix = check_dynamic_class(class_name)
+        assert is_dynamic is False, f'Class "{class_name}" should not be flagged'
+
+    @pytest.mark.parametrize('class_name', [
+        'p-4',
+        'mt-2',
+        'flex-1',
+        'bg-blue-500',
+        'text-xl',
+        'rounded-lg',
+        'shadow-md',
+    ])
+    def test_tailwind_classes_stable(self, class_name):
         """Tailwind utility classes should not be flagged."""
-        tailwind_classes = [
-            'p-4',
-            'mt-2',
-            'flex-1',
-            'bg-blue-500',
-            'text-xl',
-            'rounded-lg',
-            'shadow-md',
-        ]
-        for class_name in tailwind_classes:
-            is_dynamic, label, reason, stable_prefix = check_dynamic_class(class_name)
-            assert is_dynamic is False, f'Tailwind class "{class_name}" should not be flagged'
+        is_dynamic, label, reason, stable_prefix = check_dynamic_class(class_name)
+        assert is_dynamic is False, f'Tailwind class "{class_name}" should not be flagged'
 
     # --- Hash suffix patterns ---
 
-    def test_hash_suffix_class(self):
+    @pytest.mark.parametrize('class_name,expected_prefix', [
+        ('button-a1b2c3', 'button'),
+        ('nav-item-abcdef', 'nav-item'),
+        ('card-123abc', 'card'),
+    ])
+    def test_hash_suffix_class(self, class_name, expected_prefix):
         """Classes with hash suffixes should be flagged."""
-        dynamic_classes = [
-            ('button-a1b2c3', 'button'),
-            ('nav-item-abcdef', 'nav-item'),
-            ('card-123abc', 'card'),
-        ]
-        for class_name, expected_prefix in dynamic_classes:
-            is_dynamic, label, reason, stable_prefix = check_dynamic_class(class_name)
-            assert is_dynamic is True, f'Class "{class_name}" should be flagged'
-            assert label == 'name-hash'
-            assert stable_prefix == expected_prefix
-
-    def test_underscore_hash_suffix_class(self):
+        is_dynamic, label, reason, stable_prefix = check_dynamic_class(class_name)
+        assert is_dynamic is True, f'Class "{class_name}" should be flagged'
+        assert label == 'name-hash'
+        assert stable_prefix == expected_prefix
+
+    @pytest.mark.parametrize('class_name,expected_prefix', [
+        ('button_a1b2c3', 'button'),
+        ('nav_abcdef12', 'nav'),
+    ])
+    def test_underscore_hash_suffix_class(self, class_name, expected_prefix):
         """Classes with underscore hash suffixes should be flagged."""
         # Pattern: ^([a-z][-a-z0-9]*)_[a-f0-9]{6,}$
         # Must end with underscore followed by hex chars
-        dynamic_classes = [
-            ('button_a1b2c3', 'button'),
-            ('nav_abcdef12', 'nav'),
-        ]
-        for class_name, expected_prefix in dynamic_classes:
-            is_dynamic, label, reason, stable_prefix = check_dynamic_class(class_name)
-            assert is_dynamic is True, f'Class "{class_name}" should be flagged'
-            assert label == 'name_hash'
-
-    def test_css_modules_class(self):
+        is_dynamic, label, reason, stable_prefix = check_dynamic_class(class_name)
+        assert is_dynamic is True, f'Class "{class_name}" should be flagged'
+        assert label == 'name_hash'
+        assert stable_prefix == expected_prefix
+
+    @pytest.mark.parametrize('class_name,expected_prefix', [
+        ('nav-bar__2RnO8', 'nav-bar'),
+        ('button__xyz123', 'button'),
+        ('card-header__abcDE12', 'card-header'),
+    ])
+    def test_css_modules_class(self, class_name, expected_prefix):
         """CSS Modules pattern classes should be flagged."""
-        dynamic_classes = [
-            ('nav-bar__2RnO8', 'nav-bar'),
-            ('button__xyz123', 'button'),
-            ('card-header__abcDE12', 'card-header'),
-        ]
-        for class_name, expected_prefix in dynamic_classes:
-            is_dynamic, label, reason, stable_prefix = check_dynamic_class(class_name)
-            assert is_dynamic is True, f'Class "{class_name}" should be flagged'
-            assert label == 'name__hash'
-            assert stable_prefix == expected_prefix
+        is_dynamic, label, reason, stable_prefix = check_dynamic_class(class_name)
+        assert is_dynamic is True, f'Class "{class_name}" should be flagged'
+        assert label == 'name__hash'
+        assert stable_prefix == expected_prefix
 
     # --- Pure hash classes ---
 
-    def test_pure_hash_class(self):
+    @pytest.mark.parametrize('class_name', ['a1b2c3', 'abcdef12', '123abc456'])
+    def test_pure_hash_class(self, class_name):
         """Pure hash classes should be flagged (no stable prefix)."""
-        pure_hashes = ['a1b2c3', 'abcdef12', '123abc456']
-        for class_name in pure_hashes:
-            is_dynamic, label, reason, stable_prefix = check_dynamic_class(class_name)
-            assert is_dynamic is True, f'Class "{class_name}" should be flagged'
-            assert label == 'pure-hash'
-            assert stable_prefix == ''
-
-    def test_underscore_prefixed_hash_class(self):
+        is_dynamic, label, reason, stable_prefix = check_dynamic_class(class_name)
+        assert is_dynamic is True, f'Class "{class_name}" should be flagged'
+        assert label == 'pure-hash'
+        assert stable_prefix == ''
+
+    @pytest.mark.parametrize('class_name', ['_abcdef12', '_xyz12345'])
+    def test_underscore_prefixed_hash_class(self, class_name):
         """Underscore-prefixed hash classes should be flagged."""
-        classes = ['_abcdef12', '_xyz12345']
-        for class_name in classes:
-            is_dynamic, label, reason, stable_prefix = check_dynamic_class(class_name)
-            assert is_dynamic is True, f'Class "{class_name}" should be flagged'
-            assert label == '_hash'
+        is_dynamic, label, reason, stable_prefix = check_dynamic_class(class_name)
+        assert is_dynamic is True, f'Class "{class_name}" should be flagged'
+        assert label == '_hash'
 
     # --- CSS-in-JS patterns ---
 
-    def test_styled_components_class(self):
+    @pytest.mark.parametrize('class_name', ['sc-aXZVg', 'sc-bcXHqe', 'sc-fqkvVR'])
+    def test_styled_components_class(self, class_name):
         """Styled Components classes should be flagged."""
-        classes = ['sc-aXZVg', 'sc-bcXHqe', 'sc-fqkvVR']
-        for class_name in classes:
-            is_dynamic, label, reason, stable_prefix = check_dynamic_class(class_name)
-            assert is_dynamic is True, f'Class "{class_name}" should be flagged'
-            assert label == 'styled-components'
+        is_dynamic, label, reason, stable_prefix = check_dynamic_class(class_name)
+        assert is_dynamic is True, f'Class "{class_name}" should be flagged'
+        assert label == 'styled-components'
 
-    def test_emotion_css_class(self):
+    @pytest.mark.parametrize('class_name', ['css-1abc', 'css-abcd', 'css-xyz123'])
+    def test_emotion_css_class(self, class_name):
         """Emotion CSS classes should be flagged."""
         # Pattern: ^css-[a-z0-9]{4,}$
         # Lowercase alphanumeric after css-
-        classes = ['css-1abc', 'css-abcd', 'css-xyz123']
-        for class_name in classes:
-            is_dynamic, label, reason, stable_prefix = check_dynamic_class(class_name)
-            assert is_dynamic is True, f'Class "{class_name}" should be flagged'
-            assert label == 'emotion'
+        is_dynamic, label, reason, stable_prefix = check_dynamic_class(class_name)
+        assert is_dynamic is True, f'Class "{class_name}" should be flagged'
+        assert label == 'emotion'
 
-    def test_emotion_named_class(self):
+    @pytest.mark.parametrize('class_name', ['emotion-abc', 'emotion-xyz1'])
+    def test_emotion_named_class(self, class_name):
         """Emotion named classes should be flagged."""
         # Pattern: ^emotion-[a-z0-9]+$
-        classes = ['emotion-abc', 'emotion-xyz1']
-        for class_name in classes:
-            is_dynamic, label, reason, stable_prefix = check_dynamic_class(class_name)
-            assert is_dynamic is True, f'Class "{class_name}" should be flagged'
-            assert label == 'emotion-*'
+        is_dynamic, label, reason, stable_prefix = check_dynamic_class(class_name)
+        assert is_dynamic is True, f'Class "{class_name}" should be flagged'
+        assert label == 'emotion-*'
 
-    def test_mui_makestyles_class(self):
+    @pytest.mark.parametrize('class_name', ['makeStyles-root-123', 'makeStyles-button-456'])
+    def test_mui_makestyles_class(self, class_name):
         """MUI makeStyles classes should be flagged."""
-        classes = ['makeStyles-root-123', 'makeStyles-button-456']
-        for class_name in classes:
-            is_dynamic, label, reason, stable_prefix = check_dynamic_class(class_name)
-            assert is_dynamic is True, f'Class "{class_name}" should be flagged'
-            assert label == 'mui-makeStyles'
+        is_dynamic, label, reason, stable_prefix = check_dynamic_class(class_name)
+        assert is_dynamic is True, f'Class "{class_name}" should be flagged'
+        assert label == 'mui-makeStyles'
 
-    def test_jss_class(self):
+    @pytest.mark.parametrize('class_name', ['jss1', 'jss123', 'jss9999'])
+    def test_jss_class(self, class_name):
         """JSS generated classes should be flagged."""
-        classes = ['jss1', 'jss123', 'jss9999']
-        for class_name in classes:
-            is_dynamic, label, reason, stable_prefix = check_dynamic_class(class_name)
-            assert is_dynamic is True, f'Class "{class_name}" should be flagged'
-            assert label == 'jss'
+        is_dynamic, label, reason, stable_prefix = check_dynamic_class(class_name)
+        assert is_dynamic is True, f'Class "{class_name}" should be flagged'
+        assert label == 'jss'
 
     # --- Minified classes ---
 
-    def test_minified_class(self):
+    @pytest.mark.parametrize('class_name', ['a1234', 'X78999', 'Z99999'])
+    def test_minified_class(self, class_name):
         """Minified classes should be flagged."""
         # Pattern: ^[a-zA-Z]{1,2}[0-9]{4,}$
         # 1-2 letters followed by 4+ digits (no hex chars to avoid pure-hash match)
         # Use digits like 7, 8, 9 to avoid hex ambiguity
-        classes = ['a1234', 'X78999', 'Z99999']
-        for class_name in classes:
-            is_dynamic, label, reason, stable_prefix = check_dynamic_class(class_name)
-            assert is_dynamic is True, f'Class "{class_name}" should be flagged'
-            assert label == 'minified'
+        is_dynamic, label, reason, stable_prefix = check_dynamic_class(class_name)
+        assert is_dynamic is True, f'Class "{class_name}" should be flagged'
+        assert label == 'minified'
+
+
+# Labels exercised by the tests above - one entry per pattern row.
+EXPECTED_ID_LABELS = frozenset({
+    'ember*', 'radix-:r*:', 'numeric-only', 'react-select-*',
+    'mui-*', 'radix-*', 'headlessui-*', 'downshift-*',
+    'chakra-*', 'mantine-*', 'ng-c*', 'cdk-*', 'mat-*',
+    'uuid-*', 'hash-only', 'minified', '*-hash', '*__hash',
+    'css-in-js',
+})
+EXPECTED_CLASS_LABELS = frozenset({
+    'name-hash', 'name_hash', 'name__hash', 'pure-hash',
+    '_hash', 'styled-components', 'emotion', 'emotion-*',
+    'mui-makeStyles', 'jss', 'minified',
+})
 
 
 class TestPatternCoverage:
@@ -454,24 +442,104 @@ class TestPatternCoverage:
     def test_all_dynamic_id_patterns_have_tests(self):
         """Verify we have test cases for all dynamic ID patterns."""
         # This is a sanity check - each pattern label should appear in tests
-        expected_labels = {
-            'ember*', 'radix-:r*:', 'numeric-only', 'react-select-*',
-            'mui-*', 'radix-*', 'headlessui-*', 'downshift-*',
-            'chakra-*', 'mantine-*', 'ng-c*', 'cdk-*', 'mat-*',
-            'uuid-*', 'hash-only', 'minified', '*-hash', '*__hash',
-            'css-in-js'
-        }
-        pattern_labels = {p[1] for p in DYNAMIC_ID_PATTERNS}
-        assert pattern_labels == expected_labels, \
-            f'Missing tests for: {pattern_labels - expected_labels}'
+        assert DYNAMIC_ID_LABELS == EXPECTED_ID_LABELS, \
+            f'Missing tests for: {DYNAMIC_ID_LABELS - EXPECTED_ID_LABELS}'
 
     def test_all_dynamic_class_patterns_have_tests(self):
         """Verify we have test cases for all dynamic class patterns."""
-        expected_labels = {
-            'name-hash', 'name_hash', 'name__hash', 'pure-hash',
-            '_hash', 'styled-components', 'emotion', 'emotion-*',
-            'mui-makeStyles', 'jss', 'minified'
-        }
-        pattern_labels = {p[1] for p in DYNAMIC_CLASS_PATTERNS}
-        assert pattern_labels == expected_labels, \
-            f'Missing tests for: {pattern_labels - expected_labels}'
+        assert DYNAMIC_CLASS_LABELS == EXPECTED_CLASS_LABELS, \
+            f'Missing tests for: {DYNAMIC_CLASS_LABELS - EXPECTED_CLASS_LABELS}'
+
+
+def _first_match_id(element_id):
+    """Reference check_dynamic_id: first matching row of the table wins."""
+    for compiled, label, reason, has_prefix in DYNAMIC_ID_PATTERNS:
+        if compiled.search(element_id):
+            return True, label, reason, has_prefix
+    return False, '', '', False
+
+
+def _first_match_class(class_name):
+    """Reference check_dynamic_class: first matching row of the table wins."""
+    for compiled, label, reason in DYNAMIC_CLASS_PATTERNS:
+        match = compiled.match(class_name)
+        if match:
+            return True, label, reason, match.group(1) if match.lastindex else ''
+    return False, '', '', ''
+
+
+def _pattern_corpus(size=5000, seed=0):
+    """Values aimed at the fast paths and literal routing, plus edge cases.
+
+    Covers table prefixes, hex and UUID shapes, jss, trailing newlines,
+    case-folding quirks ('\u017f' matches 's', the Kelvin sign matches
+    'k') and non-ASCII digits.
+    """
+    rng = random.Random(seed)
+    tokens = [
+        'ember', ':r', 'react-select-', 'mui-', 'radix-', 'headlessui-',
+        'downshift-', 'chakra-', 'mantine-', 'ng-c', 'cdk-', 'mat-', 'sc-',
+        'css-', 'emotion-', 'styled-', 'makeStyles-', 'jss', 'JSS', '_', '__',
+        '-', ':', 'nav', 'item', 'abc', 'K', '\u212a', '\u017f', '\u00b2',
+        '\u0661', '\n',
+    ]
+    alpha = 'abcdefxyzABCDEFXYZ0123456789-_:'
+    hexd = '0123456789abcdefABCDEF'
+
+    def hex_run(n):
+        return ''.join(rng.choice(hexd) for _ in range(n))
+
+    corpus = [
+        'a1b2c3d4-e5f6-7890-abcd-ef1234567890', 'A1B2C3D4-E5F6-', '123\n',
+        '\u0661\u0662\u0663', 'jss12', 'jss12\n', '\u017fc-abcdef',
+        'ma\u212aeStyles-root-1', 'abcdef123456\n', 'ember\u0661',
+        'nav-bar__2RnO8', 'card_abcdef12',
+    ]
+    for _ in range(size):
+        shape = rng.random()
+        if shape < 0.4:
+            corpus.append(''.join(
+                rng.choice(tokens + list(alpha)) for _ in range(rng.randint(1, 6))
+            ))
+        elif shape < 0.6:
+            corpus.append(rng.choice(tokens) + hex_run(rng.randint(0, 14)))
+        elif shape < 0.75:
+            corpus.append(
+                ''.join(rng.choice('0123456789') for _ in range(rng.randint(1, 8)))
+                + rng.choice(['', '-', 'a', '\n'])
+            )
+        elif shape < 0.85:
+            uuid = f'{hex_run(8)}-{hex_run(4)}-{hex_run(4)}-{hex_run(4)}-{hex_run(12)}'
+            corpus.append(uuid[:rng.randint(10, 36)])
+        else:
+            corpus.append(
+                ''.join(rng.choice('abcxyz-_') for _ in range(rng.randint(2, 10)))
+                + rng.choice(['-', '_', '__'])
+                + ''.join(rng.choice(alpha) for _ in range(rng.randint(3, 10)))
+            )
+    return [value for value in corpus if value]
+
+
+class TestFastPathsMatchTableOrder:
+    """The fused matchers and fast paths must agree with a plain first-match
+    loop over the pattern tables; a row added in the wrong place would
+    otherwise be skipped silently.
+    """
+
+    CORPUS = _pattern_corpus()
+
+    def test_check_dynamic_id_matches_first_match_loop(self):
+        """check_dynamic_id should return what the first matching row gives."""
+        mismatches = [
+            value for value in self.CORPUS
+            if tuple(check_dynamic_id(value)) != _first_match_id(value)
+        ]
+        assert mismatches == []
+
+    def test_check_dynamic_class_matches_first_match_loop(self):
+        """check_dynamic_class should return what the first matching row gives."""
+        mismatches = [
+            value for value in self.CORPUS
+            if tuple(check_dynamic_class(value)) != _first_match_class(value)
+        ]
+        assert mismatches == []
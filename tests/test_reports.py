@@ -1,254 +1,190 @@
 """Tests for report generation functions."""
 
 import json
+from collections import namedtuple
 import pytest
 from pendo_feasibility_scraper import (
     generate_report,
     generate_json_report,
     PageAnalysis,
     ElementAnalysis,
-    SoftwareDetection,
     IframeInfo,
     ShadowDOMInfo,
     CanvasInfo,
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def simple_page_analysis():
-    """Create a simple page analysis for testing."""
-    buttons = ElementAnalysis()
-    buttons.total = 5
-    buttons.stable_ids = 3
-    buttons.dynamic_ids = 1
-    buttons.no_ids = 1
-    buttons.has_pendo_attr = 1
-    buttons.has_text_content = 4
-    buttons.stable_id_examples = ['submit-btn', 'cancel-btn']
-    buttons.dynamic_id_examples = [('react-select-1-input', 'React Select instance ID')]
-    buttons.pendo_attr_examples = ['data-pendo-id="cta"']
-
-    inputs = ElementAnalysis()
-    inputs.total = 3
-    inputs.stable_ids = 2
-    inputs.no_ids = 1
-
-    links = ElementAnalysis()
-    links.total = 10
-    links.stable_ids = 8
-
-    analysis = PageAnalysis(url='https://example.com')
-    analysis.buttons = buttons
-    analysis.inputs = inputs
-    analysis.links = links
-    analysis.dynamic_class_count = 3
-    analysis.dynamic_class_examples = [
-        ('btn-abc123', 'Dynamic hash suffix [prefix: btn]'),
-        ('sc-aXZVg', 'Styled Components hash [NO stable prefix]'),
-    ]
-
-    return analysis
-
-
-@pytest.fixture
-def simple_software_detection():
-    """Create simple software detection for testing."""
-    detection = SoftwareDetection()
-    detection.frontend_frameworks = ['React', 'Next.js']
-    detection.css_frameworks = ['Material UI']
-    detection.analytics_tools = ['Segment', 'Heap']
-    return detection
-
-
+    """Create a simple page analysis for testing.
+
+    Module-scoped: report generation only reads its inputs.
+    """
+    buttons = ElementAnalysis(
+        total=5,
+        stable_ids=3,
+        dynamic_ids=1,
+        no_ids=1,
+        has_pendo_attr=1,
+        has_text_content=4,
+        stable_id_examples=['submit-btn', 'cancel-btn'],
+        dynamic_id_examples=[('react-select-1-input', 'React Select instance ID')],
+        pendo_attr_examples=['data-pendo-id="cta"'],
+    )
+
+    return PageAnalysis(
+        url='https://example.com',
+        buttons=buttons,
+        inputs=ElementAnalysis(total=3, stable_ids=2, no_ids=1),
+        links=ElementAnalysis(total=10, stable_ids=8),
+        dynamic_class_count=3,
+        dynamic_class_examples=[
+            ('btn-abc123', 'Dynamic hash suffix [prefix: btn]'),
+            ('sc-aXZVg', 'Styled Components hash [NO stable prefix]'),
+        ],
+    )
+
+
+@pytest.fixture(scope='module')
+def rendered_report(simple_page_analysis, simple_software_detection):
+    """Text report for the simple fixtures, rendered once per module."""
+    return generate_report(
+        'https://example.com',
+        [simple_page_analysis],
+        simple_software_detection
+    )
+
+
+RenderedJson = namedtuple('RenderedJson', 'report serialized')
+
+
+@pytest.fixture(scope='module')
+def rendered_json(simple_page_analysis, simple_software_detection):
+    """JSON report for the simple fixtures, built and serialized once per
+    module.
+
+    json.dumps raises on any value that is not JSON-serializable, so every
+    test using this fixture also relies on that guarantee.
+    """
+    report = generate_json_report(
+        'https://example.com',
+        [simple_page_analysis],
+        simple_software_detection
+    )
+    return RenderedJson(report, json.dumps(report))
+
+
+@pytest.mark.report
 class TestGenerateReport:
     """Tests for text report generation."""
 
-    def test_report_contains_header(self, simple_page_analysis, simple_software_detection):
-        """Report should contain header with title."""
-        report = generate_report(
-            'https://example.com',
-            [simple_page_analysis],
-            simple_software_detection
-        )
-
-        assert 'PENDO FEASIBILITY REPORT' in report
-
-    def test_report_contains_site_url(self, simple_page_analysis, simple_software_detection):
-        """Report should contain the site URL."""
-        report = generate_report(
-            'https://example.com',
-            [simple_page_analysis],
-            simple_software_detection
-        )
-
-        assert 'Site: https://example.com' in report
-
-    def test_report_contains_page_count(self, simple_page_analysis, simple_software_detection):
-        """Report should contain page count."""
-        report = generate_report(
-            'https://example.com',
-            [simple_page_analysis],
-            simple_software_detection
-        )
-
-        assert 'Pages Analysed: 1' in report
-
-    def test_report_contains_software_detection(self, simple_page_analysis, simple_software_detection):
-        """Report should list detected software."""
-        report = generate_report(
-            'https://example.com',
-            [simple_page_analysis],
-            simple_software_detection
-        )
-
-        assert 'DETECTED SOFTWARE' in report
-        assert 'React' in report
-        assert 'Next.js' in report
-        assert 'Material UI' in report
-        assert 'Segment' in report
-
-    def test_report_contains_button_analysis(self, simple_page_analysis, simple_software_detection):
-        """Report should contain button analysis."""
-        report = generate_report(
-            'https://example.com',
-            [simple_page_analysis],
-            simple_software_detection
-        )
-
-        assert 'BUTTONS' in report
-        assert 'Total: 5' in report
-        assert 'With stable IDs: 3' in report
-
-    def test_report_contains_input_analysis(self, simple_page_analysis, simple_software_detection):
-        """Report should contain input analysis."""
-        report = generate_report(
-            'https://example.com',
-            [simple_page_analysis],
-            simple_software_detection
-        )
-
-        assert 'INPUTS' in report
-        assert 'Total: 3' in report
-
-    def test_report_contains_dynamic_css_warning(self, simple_page_analysis, simple_software_detection):
+    @pytest.mark.parametrize('needle', [
+        # Header
+        'PENDO FEASIBILITY REPORT',
+        'Site: https://example.com',
+        'Pages Analysed: 1',
+        # Software detection
+        'DETECTED SOFTWARE',
+        'React',
+        'Next.js',
+        'Material UI',
+        'Segment',
+        # Button analysis
+        'BUTTONS',
+        'Total: 5',
+        'With stable IDs: 3',
+        # Input analysis
+        'INPUTS',
+        'Total: 3',
+        # Recommendations
+        'SUMMARY & RECOMMENDATIONS',
+    ])
+    def test_report_contains(self, rendered_report, needle):
+        """Report should contain each expected section and value."""
+        assert needle in rendered_report
+
+    def test_report_contains_dynamic_css_warning(self, rendered_report):
         """Report should warn about dynamic CSS classes."""
-        report = generate_report(
-            'https://example.com',
-            [simple_page_analysis],
-            simple_software_detection
-        )
+        assert 'CRITICAL' in rendered_report or 'CSS CLASS ANALYSIS' in rendered_report
 
-        assert 'CRITICAL' in report or 'CSS CLASS ANALYSIS' in report
-
-    def test_report_contains_recommendations(self, simple_page_analysis, simple_software_detection):
-        """Report should contain recommendations."""
-        report = generate_report(
-            'https://example.com',
-            [simple_page_analysis],
-            simple_software_detection
-        )
-
-        assert 'SUMMARY & RECOMMENDATIONS' in report
-
-    def test_report_contains_example_ids(self, simple_page_analysis, simple_software_detection):
+    def test_report_contains_example_ids(self, rendered_report):
         """Report should show example stable IDs."""
-        report = generate_report(
-            'https://example.com',
-            [simple_page_analysis],
-            simple_software_detection
-        )
+        assert 'submit-btn' in rendered_report or 'cancel-btn' in rendered_report
 
-        assert 'submit-btn' in report or 'cancel-btn' in report
-
-    def test_report_shows_pendo_attributes(self, simple_page_analysis, simple_software_detection):
+    def test_report_shows_pendo_attributes(self, rendered_report):
         """Report should highlight pendo attributes when present."""
-        report = generate_report(
-            'https://example.com',
-            [simple_page_analysis],
-            simple_software_detection
-        )
-
-        assert 'data-pendo' in report or 'EXCELLENT' in report
+        assert 'data-pendo' in rendered_report or 'EXCELLENT' in rendered_report
+
+
+def low_risk_analysis():
+    """All elements have stable IDs."""
+    return PageAnalysis(
+        url='https://example.com',
+        buttons=ElementAnalysis(total=10, stable_ids=10),
+        inputs=ElementAnalysis(total=5, stable_ids=5),
+        dynamic_class_count=0,
+    )
+
+
+def high_risk_analysis():
+    """No stable IDs and many dynamic classes."""
+    return PageAnalysis(
+        url='https://example.com',
+        buttons=ElementAnalysis(total=10, dynamic_ids=10),
+        inputs=ElementAnalysis(total=5, no_ids=5),
+        dynamic_class_count=50,
+        dynamic_class_examples=[('test', 'reason')],
+    )
+
+
+def shadow_dom_analysis():
+    """Stable IDs, but content inside shadow roots."""
+    return PageAnalysis(
+        url='https://example.com',
+        buttons=ElementAnalysis(total=10, stable_ids=10),
+        shadow_dom=ShadowDOMInfo(
+            count=5,
+            page_url='https://example.com',
+            element_tags=['custom-element']
+        ),
+    )
 
 
+@pytest.mark.report
 class TestGenerateReportRiskLevels:
     """Tests for risk level calculation in reports."""
 
-    def test_low_risk_report(self, simple_software_detection):
-        """High ID stability should result in low risk."""
-        # All elements have stable IDs
-        buttons = ElementAnalysis()
-        buttons.total = 10
-        buttons.stable_ids = 10
-
-        inputs = ElementAnalysis()
-        inputs.total = 5
-        inputs.stable_ids = 5
-
-        analysis = PageAnalysis(url='https://example.com')
-        analysis.buttons = buttons
-        analysis.inputs = inputs
-        analysis.dynamic_class_count = 0
-
-        report = generate_report('https://example.com', [analysis], simple_software_detection)
-
-        assert 'Risk Level: LOW' in report
-
-    def test_high_risk_with_no_stable_ids(self, simple_software_detection):
-        """No stable IDs should result in higher risk."""
-        buttons = ElementAnalysis()
-        buttons.total = 10
-        buttons.dynamic_ids = 10
+    # Each expected entry is a tuple of alternatives; at least one must appear.
+    @pytest.mark.parametrize('factory,expected', [
+        # High ID stability should result in low risk
+        (low_risk_analysis, [('Risk Level: LOW',)]),
+        # No stable IDs should result in higher risk
+        (high_risk_analysis, [('HIGH', 'MODERATE')]),
+        # Shadow DOM presence should increase risk
+        (shadow_dom_analysis, [('SHADOW DOM',), ('Shadow Roots: 5', 'Total Shadow Roots: 5')]),
+    ])
+    def test_risk_level(self, simple_software_detection, factory, expected):
+        """Report risk section should reflect the analysed page."""
+        report = generate_report('https://example.com', [factory()], simple_software_detection)
 
-        inputs = ElementAnalysis()
-        inputs.total = 5
-        inputs.no_ids = 5
-
-        analysis = PageAnalysis(url='https://example.com')
-        analysis.buttons = buttons
-        analysis.inputs = inputs
-        analysis.dynamic_class_count = 50
-        analysis.dynamic_class_examples = [('test', 'reason')]
-
-        report = generate_report('https://example.com', [analysis], simple_software_detection)
-
-        assert 'HIGH' in report or 'MODERATE' in report
-
-    def test_shadow_dom_increases_risk(self, simple_software_detection):
-        """Shadow DOM presence should increase risk."""
-        buttons = ElementAnalysis()
-        buttons.total = 10
-        buttons.stable_ids = 10
-
-        analysis = PageAnalysis(url='https://example.com')
-        analysis.buttons = buttons
-        analysis.shadow_dom = ShadowDOMInfo(
-            count=5,
-            page_url='https://example.com',
-            element_tags=['custom-element']
-        )
-
-        report = generate_report('https://example.com', [analysis], simple_software_detection)
-
-        assert 'SHADOW DOM' in report
-        assert 'Shadow Roots: 5' in report or 'Total Shadow Roots: 5' in report
+        for alternatives in expected:
+            assert any(text in report for text in alternatives), alternatives
 
 
+@pytest.mark.report
 class TestGenerateReportIframes:
     """Tests for iframe reporting."""
 
     def test_report_shows_iframes(self, simple_software_detection):
         """Report should show iframe information."""
-        buttons = ElementAnalysis()
-        buttons.total = 5
-        buttons.stable_ids = 5
-
-        analysis = PageAnalysis(url='https://example.com')
-        analysis.buttons = buttons
-        analysis.iframes = [
-            IframeInfo(src='https://other.com/embed', page_url='https://example.com', is_cross_origin=True),
-            IframeInfo(src='https://example.com/frame', page_url='https://example.com', is_cross_origin=False),
-        ]
+        analysis = PageAnalysis(
+            url='https://example.com',
+            buttons=ElementAnalysis(total=5, stable_ids=5),
+            iframes=[
+                IframeInfo(src='https://other.com/embed', page_url='https://example.com', is_cross_origin=True),
+                IframeInfo(src='https://example.com/frame', page_url='https://example.com', is_cross_origin=False),
+            ],
+        )
 
         report = generate_report('https://example.com', [analysis], simple_software_detection)
 
@@ -257,36 +193,33 @@ class TestGenerateReportIframes:
 
     def test_report_marks_cross_origin(self, simple_software_detection):
         """Report should mark cross-origin iframes."""
-        buttons = ElementAnalysis()
-        buttons.total = 5
-        buttons.stable_ids = 5
-
-        analysis = PageAnalysis(url='https://example.com')
-        analysis.buttons = buttons
-        analysis.iframes = [
-            IframeInfo(src='https://other.com/embed', page_url='https://example.com', is_cross_origin=True),
-        ]
+        analysis = PageAnalysis(
+            url='https://example.com',
+            buttons=ElementAnalysis(total=5, stable_ids=5),
+            iframes=[
+                IframeInfo(src='https://other.com/embed', page_url='https://example.com', is_cross_origin=True),
+            ],
+        )
 
         report = generate_report('https://example.com', [analysis], simple_software_detection)
 
         assert 'CROSS-ORIGIN' in report
 
 
+@pytest.mark.report
 class TestGenerateReportCanvas:
     """Tests for canvas reporting."""
 
     def test_report_shows_canvas(self, simple_software_detection):
         """Report should show canvas information."""
-        buttons = ElementAnalysis()
-        buttons.total = 5
-        buttons.stable_ids = 5
-
-        analysis = PageAnalysis(url='https://example.com')
-        analysis.buttons = buttons
-        analysis.canvas = CanvasInfo(
-            count=2,
-            page_url='https://example.com',
-            dimensions=['800x600', '400x300']
+        analysis = PageAnalysis(
+            url='https://example.com',
+            buttons=ElementAnalysis(total=5, stable_ids=5),
+            canvas=CanvasInfo(
+                count=2,
+                page_url='https://example.com',
+                dimensions=['800x600', '400x300']
+            ),
         )
 
         report = generate_report('https://example.com', [analysis], simple_software_detection)
@@ -295,97 +228,61 @@ class TestGenerateReportCanvas:
         assert 'Total Count: 2' in report
 
 
+@pytest.mark.json_report
 class TestGenerateJsonReport:
     """Tests for JSON report generation."""
 
-    def test_json_report_structure(self, simple_page_analysis, simple_software_detection):
+    @pytest.mark.parametrize('key', ['meta', 'software', 'pages'])
+    def test_json_report_structure(self, rendered_json, key):
         """JSON report should have correct structure."""
-        report = generate_json_report(
-            'https://example.com',
-            [simple_page_analysis],
-            simple_software_detection
-        )
+        assert key in rendered_json.report
 
-        assert 'meta' in report
-        assert 'software' in report
-        assert 'pages' in report
-
-    def test_json_report_meta(self, simple_page_analysis, simple_software_detection):
+    def test_json_report_meta(self, rendered_json):
         """JSON report meta should contain site info."""
-        report = generate_json_report(
-            'https://example.com',
-            [simple_page_analysis],
-            simple_software_detection
-        )
-
-        assert report['meta']['site'] == 'https://example.com'
-        assert report['meta']['domain'] == 'example.com'
-        assert report['meta']['pages_analysed'] == 1
-        assert 'timestamp' in report['meta']
+        assert rendered_json.report['meta']['site'] == 'https://example.com'
+        assert rendered_json.report['meta']['domain'] == 'example.com'
+        assert rendered_json.report['meta']['pages_analysed'] == 1
+        assert 'timestamp' in rendered_json.report['meta']
 
-    def test_json_report_software(self, simple_page_analysis, simple_software_detection):
+    def test_json_report_software(self, rendered_json):
         """JSON report should include software detection."""
-        report = generate_json_report(
-            'https://example.com',
-            [simple_page_analysis],
-            simple_software_detection
-        )
-
-        assert report['software']['frontend_frameworks'] == ['React', 'Next.js']
-        assert report['software']['css_frameworks'] == ['Material UI']
-        assert report['software']['analytics_tools'] == ['Segment', 'Heap']
+        assert rendered_json.report['software']['frontend_frameworks'] == ['React', 'Next.js']
+        assert rendered_json.report['software']['css_frameworks'] == ['Material UI']
+        assert rendered_json.report['software']['analytics_tools'] == ['Segment', 'Heap']
 
-    def test_json_report_pages(self, simple_page_analysis, simple_software_detection):
+    def test_json_report_pages(self, rendered_json):
         """JSON report should include page analysis."""
-        report = generate_json_report(
-            'https://example.com',
-            [simple_page_analysis],
-            simple_software_detection
-        )
-
-        assert len(report['pages']) == 1
-        page = report['pages'][0]
+        assert len(rendered_json.report['pages']) == 1
+        page = rendered_json.report['pages'][0]
         assert page['url'] == 'https://example.com'
         assert 'buttons' in page
         assert 'inputs' in page
         assert 'links' in page
 
-    def test_json_report_element_details(self, simple_page_analysis, simple_software_detection):
+    def test_json_report_element_details(self, rendered_json):
         """JSON report should include element analysis details."""
-        report = generate_json_report(
-            'https://example.com',
-            [simple_page_analysis],
-            simple_software_detection
-        )
-
-        buttons = report['pages'][0]['buttons']
+        buttons = rendered_json.report['pages'][0]['buttons']
         assert buttons['total'] == 5
         assert buttons['stable_ids'] == 3
         assert buttons['dynamic_ids'] == 1
 
-    def test_json_report_serializable(self, simple_page_analysis, simple_software_detection):
+    def test_json_report_serializable(self, rendered_json):
         """JSON report should be fully serializable."""
-        report = generate_json_report(
-            'https://example.com',
-            [simple_page_analysis],
-            simple_software_detection
-        )
-
-        # Should not raise - verifies all data is JSON-serializable
-        serialized = json.dumps(report)
-        deserialized = json.loads(serialized)
+        deserialized = json.loads(rendered_json.serialized)
 
         # Verify structure is preserved (note: tuples become lists in JSON)
-        assert deserialized['meta']['site'] == report['meta']['site']
-        assert deserialized['meta']['pages_analysed'] == report['meta']['pages_analysed']
-        assert len(deserialized['pages']) == len(report['pages'])
+        assert deserialized['meta']['site'] == rendered_json.report['meta']['site']
+        assert deserialized['meta']['pages_analysed'] == rendered_json.report['meta']['pages_analysed']
+        assert len(deserialized['pages']) == len(rendered_json.report['pages'])
 
     def test_json_report_with_iframes(self, simple_software_detection):
         """JSON report should include iframe data."""
-        analysis = PageAnalysis(url='https://example.com')
-        analysis.iframes = [
-            IframeInfo(src='https://other.com/embed', page_url='https://example.com', is_cross_origin=True),
-        ]
+        analysis = PageAnalysis(
+            url='https://example.com',
+            iframes=[
+                IframeInfo(src='https://other.com/embed', page_url='https://example.com', is_cross_origin=True),
+            ],
+        )
 
         report = generate_json_report(
             'https://example.com',
@@ -400,11 +297,13 @@ class TestGenerateJsonReport:
 
     def test_json_report_with_shadow_dom(self, simple_software_detection):
         """JSON report should include shadow DOM data."""
-        analysis = PageAnalysis(url='https://example.com')
-        analysis.shadow_dom = ShadowDOMInfo(
-            count=2,
-            page_url='https://example.com',
-            element_tags=['custom-el']
+        analysis = PageAnalysis(
+            url='https://example.com',
+            shadow_dom=ShadowDOMInfo(
+                count=2,
+                page_url='https://example.com',
+                element_tags=['custom-el']
+            ),
         )
 
         report = generate_json_report(
@@ -419,11 +318,13 @@ class TestGenerateJsonReport:
 
     def test_json_report_with_canvas(self, simple_software_detection):
         """JSON report should include canvas data."""
-        analysis = PageAnalysis(url='https://example.com')
-        analysis.canvas = CanvasInfo(
-            count=1,
-            page_url='https://example.com',
-            dimensions=['800x600']
+        analysis = PageAnalysis(
+            url='https://example.com',
+            canvas=CanvasInfo(
+                count=1,
+                page_url='https://example.com',
+                dimensions=['800x600']
+            ),
         )
 
         report = generate_json_report(
@@ -440,17 +341,16 @@ class TestGenerateJsonReport:
 class TestMultiPageReport:
     """Tests for reports with multiple pages."""
 
+    @pytest.mark.report
     def test_aggregates_across_pages(self, simple_software_detection):
         """Report should aggregate data across multiple pages."""
-        pages = []
-        for i in range(3):
-            buttons = ElementAnalysis()
-            buttons.total = 5
-            buttons.stable_ids = 3
-
-            analysis = PageAnalysis(url=f'https://example.com/page{i}')
-            analysis.buttons = buttons
-            pages.append(analysis)
+        pages = [
+            PageAnalysis(
+                url=f'https://example.com/page{i}',
+                buttons=ElementAnalysis(total=5, stable_ids=3),
+            )
+            for i in range(3)
+        ]
 
         report = generate_report('https://example.com', pages, simple_software_detection)
 
@@ -458,6 +358,7 @@ class TestMultiPageReport:
         # Total buttons should be 15 (5 * 3)
         assert 'Total: 15' in report
 
+    @pytest.mark.json_report
     def test_json_includes_all_pages(self, simple_software_detection):
         """JSON report should include all page analyses."""
         pages = []
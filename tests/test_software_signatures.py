@@ -4,9 +4,25 @@ The actual detect_software function requires a live Playwright page,
 so these tests focus on the signature definitions and structure.
 """
 
+from dataclasses import asdict
+
 import pytest
 from pendo_feasibility_scraper import SOFTWARE_SIGNATURES, SoftwareDetection
 
+pytestmark = pytest.mark.signatures
+
+
+# Index views over SOFTWARE_SIGNATURES, built once at import:
+# category -> set of names, and category -> name -> list of checks.
+SIGNATURE_NAMES = {
+    category: {name for _, name in signatures}
+    for category, signatures in SOFTWARE_SIGNATURES.items()
+}
+SIGNATURE_CHECKS = {category: {} for category in SOFTWARE_SIGNATURES}
+for _category, _signatures in SOFTWARE_SIGNATURES.items():
+    for _check, _name in _signatures:
+        SIGNATURE_CHECKS[_category].setdefault(_name, []).append(_check)
+
 
 class TestSoftwareSignatureStructure:
     """Tests for the structure of software signatures."""
@@ -18,23 +34,19 @@ class TestSoftwareSignatureStructure:
         for category in expected_categories:
             assert category in SOFTWARE_SIGNATURES, f'Missing category: {category}'
 
-    def test_signatures_are_tuples(self):
-        """Each signature should be a tuple of (check, name)."""
-        for category, signatures in SOFTWARE_SIGNATURES.items():
-            for sig in signatures:
-                assert isinstance(sig, tuple), f'Signature in {category} is not a tuple'
-                assert len(sig) == 2, f'Signature in {category} should have 2 elements'
-                check, name = sig
-                assert isinstance(check, str), f'Check in {category} should be string'
-                assert isinstance(name, str), f'Name in {category} should be string'
-
-    def test_checks_are_valid_js(self):
-        """Each check should look like valid JavaScript."""
-        for category, signatures in SOFTWARE_SIGNATURES.items():
-            for check, name in signatures:
-                # Should reference window or document
-                assert 'window.' in check or 'document.' in check, \
-                    f'Check for {name} should reference window or document'
+    @pytest.mark.parametrize('category', list(SOFTWARE_SIGNATURES))
+    def test_signatures_are_well_formed(self, category):
+        """Each signature should be a (check, name) tuple of strings whose
+        check looks like valid JavaScript."""
+        for sig in SOFTWARE_SIGNATURES[category]:
+            assert isinstance(sig, tuple), f'Signature in {category} is not a tuple'
+            assert len(sig) == 2, f'Signature in {category} should have 2 elements'
+            check, name = sig
+            assert isinstance(check, str), f'Check in {category} should be string'
+            assert isinstance(name, str), f'Name in {category} should be string'
+            # Should reference window or document
+            assert 'window.' in check or 'document.' in check, \
+                f'Check for {name} should reference window or document'
 
 
 class TestFrontendFrameworkSignatures:
@@ -42,19 +54,14 @@ class TestFrontendFrameworkSignatures:
 
     def test_expected_frameworks_present(self):
         """All expected frontend frameworks should have signatures."""
-        signatures = SOFTWARE_SIGNATURES['frontend_frameworks']
-        framework_names = [name for _, name in signatures]
-
         expected = ['Next.js', 'Nuxt.js', 'AngularJS', 'Angular', 'Gatsby', 'Ember.js', 'Vue.js', 'React']
 
         for framework in expected:
-            assert framework in framework_names, f'Missing signature for {framework}'
+            assert framework in SIGNATURE_NAMES['frontend_frameworks'], f'Missing signature for {framework}'
 
     def test_react_detection_methods(self):
         """React should be detectable via data-reactroot."""
-        signatures = SOFTWARE_SIGNATURES['frontend_frameworks']
-
-        react_sigs = [check for check, name in signatures if name == 'React']
+        react_sigs = SIGNATURE_CHECKS['frontend_frameworks'].get('React', [])
         assert len(react_sigs) >= 1
 
         # Should look for data-reactroot
@@ -62,13 +69,10 @@ class TestFrontendFrameworkSignatures:
 
     def test_nextjs_detection_methods(self):
         """Next.js should have multiple detection methods."""
-        signatures = SOFTWARE_SIGNATURES['frontend_frameworks']
-
-        nextjs_sigs = [(check, name) for check, name in signatures if name == 'Next.js']
-        assert len(nextjs_sigs) >= 1
+        checks = SIGNATURE_CHECKS['frontend_frameworks'].get('Next.js', [])
+        assert len(checks) >= 1
 
         # Should check for __NEXT_DATA__ or __next element
-        checks = [check for check, _ in nextjs_sigs]
         assert any('__NEXT' in check or '__next' in check for check in checks)
 
 
@@ -77,13 +81,10 @@ class TestCssFrameworkSignatures:
 
     def test_expected_css_frameworks_present(self):
         """All expected CSS frameworks should have signatures."""
-        signatures = SOFTWARE_SIGNATURES['css_frameworks']
-        framework_names = [name for _, name in signatures]
-
         expected = ['Chakra UI', 'Mantine', 'Ant Design', 'Material UI', 'Blueprint']
 
         for framework in expected:
-            assert framework in framework_names, f'Missing signature for {framework}'
+            assert framework in SIGNATURE_NAMES['css_frameworks'], f'Missing signature for {framework}'
 
     def test_frameworks_use_class_prefix_detection(self):
         """CSS frameworks should be detected by class prefixes."""
@@ -100,33 +101,29 @@ class TestAnalyticsSignatures:
 
     def test_expected_analytics_present(self):
         """All expected analytics tools should have signatures."""
-        signatures = SOFTWARE_SIGNATURES['analytics']
-        tool_names = [name for _, name in signatures]
-
         expected = [
             'Pendo (already installed)', 'Segment', 'Mixpanel', 'Amplitude',
             'Heap', 'FullStory', 'Hotjar', 'Google Tag Manager', 'Intercom'
         ]
 
         for tool in expected:
-            assert tool in tool_names, f'Missing signature for {tool}'
+            assert tool in SIGNATURE_NAMES['analytics'], f'Missing signature for {tool}'
 
     def test_pendo_detection(self):
         """Pendo should be detectable."""
-        signatures = SOFTWARE_SIGNATURES['analytics']
-
-        pendo_sigs = [check for check, name in signatures if 'Pendo' in name]
+        pendo_sigs = [
+            check
+            for name, checks in SIGNATURE_CHECKS['analytics'].items() if 'Pendo' in name
+            for check in checks
+        ]
         assert len(pendo_sigs) >= 1
         assert any('pendo' in check.lower() for check in pendo_sigs)
 
     def test_pendo_competitors_present(self):
         """Pendo competitors should be detectable."""
-        signatures = SOFTWARE_SIGNATURES['analytics']
-        tool_names = [name for _, name in signatures]
-
         competitors = ['Appcues', 'WalkMe', 'Userpilot', 'Chameleon']
         for competitor in competitors:
-            assert competitor in tool_names, f'Missing Pendo competitor: {competitor}'
+            assert competitor in SIGNATURE_NAMES['analytics'], f'Missing Pendo competitor: {competitor}'
 
 
 class TestOtherToolSignatures:
@@ -134,13 +131,10 @@ class TestOtherToolSignatures:
 
     def test_expected_other_tools_present(self):
         """Expected other tools should have signatures."""
-        signatures = SOFTWARE_SIGNATURES['other']
-        tool_names = [name for _, name in signatures]
-
         expected = ['Sentry', 'Datadog RUM', 'LaunchDarkly', 'Stripe']
 
         for tool in expected:
-            assert tool in tool_names, f'Missing signature for {tool}'
+            assert tool in SIGNATURE_NAMES['other'], f'Missing signature for {tool}'
 
 
 class TestSoftwareDetectionDataClass:
@@ -177,8 +171,7 @@ class TestSoftwareDetectionDataClass:
         detection.frontend_frameworks = ['React']
         detection.analytics_tools = ['Pendo (already installed)']
 
-        # __dict__ should work for serialization
-        data = detection.__dict__
+        data = asdict(detection)
 
         assert data['frontend_frameworks'] == ['React']
         assert data['analytics_tools'] == ['Pendo (already installed)']
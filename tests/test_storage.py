@@ -1,5 +1,6 @@
 """Tests for database storage operations."""
 
+import itertools
 import json
 import sqlite3
 from pathlib import Path
@@ -9,11 +10,16 @@ import pytest
 from server.storage import (
     init_db,
     create_scan,
+    create_scans,
     update_status,
     attach_results,
+    finalize_scan,
+    fail_scan,
     get_scan,
     list_scans,
     get_connection,
+    get_pool,
+    ConnectionPool,
 )
 
 
@@ -25,12 +31,10 @@ class TestInitDb:
         init_db()
 
         # Verify table exists
-        conn = get_connection()
-        cursor = conn.execute(
-            "SELECT name FROM sqlite_master WHERE type='table' AND name='scans'"
-        )
-        result = cursor.fetchone()
-        conn.close()
+        with get_connection() as conn:
+            result = conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='table' AND name='scans'"
+            ).fetchone()
 
         assert result is not None
         assert result['name'] == 'scans'
@@ -39,10 +43,9 @@ class TestInitDb:
         """init_db should create table with all required columns."""
         init_db()
 
-        conn = get_connection()
-        cursor = conn.execute("PRAGMA table_info(scans)")
-        columns = {row['name']: row for row in cursor.fetchall()}
-        conn.close()
+        with get_connection() as conn:
+            rows = conn.execute("PRAGMA table_info(scans)").fetchall()
+        columns = {row['name']: row for row in rows}
 
         expected_columns = [
             'id', 'created_at', 'status', 'target_url', 'config_json',
@@ -57,25 +60,126 @@ class TestInitDb:
         init_db()
         init_db()  # Should not raise
 
-        conn = get_connection()
-        cursor = conn.execute(
-            "SELECT COUNT(*) as count FROM sqlite_master WHERE type='table' AND name='scans'"
-        )
-        result = cursor.fetchone()
-        conn.close()
+        with get_connection() as conn:
+            result = conn.execute(
+                "SELECT COUNT(*) as count FROM sqlite_master WHERE type='table' AND name='scans'"
+            ).fetchone()
 
         assert result['count'] == 1
 
+    def test_init_db_creates_data_dirs(self, monkeypatch, tmp_path):
+        """init_db should create missing data and reports directories."""
+        data_dir = tmp_path / 'nested' / 'data'
+        monkeypatch.setattr('server.storage.DATA_DIR', data_dir)
+        monkeypatch.setattr('server.storage.REPORTS_DIR', data_dir / 'reports')
+        monkeypatch.setattr('server.storage.DB_PATH', data_dir / 'feasibility.db')
+
+        init_db()
+
+        assert (data_dir / 'reports').is_dir()
+
+    def test_connection_uses_wal_journal(self, mock_storage_paths):
+        """get_connection should put file databases in WAL mode."""
+        with get_connection() as conn:
+            mode = conn.execute('PRAGMA journal_mode').fetchone()[0]
+            synchronous = conn.execute('PRAGMA synchronous').fetchone()[0]
+
+        assert mode == 'wal'
+        assert synchronous == 1  # NORMAL
+
+    def test_pool_reused_per_path(self, mock_storage_paths, monkeypatch, tmp_path):
+        """get_pool should reuse its pool until DB_PATH changes."""
+        pool = get_pool()
+        assert get_pool() is pool
+
+        monkeypatch.setattr('server.storage.DB_PATH', tmp_path / 'other.db')
+        assert get_pool() is not pool
+
+    def test_pool_reopened_after_fork(self, mock_storage_paths, monkeypatch):
+        """A forked child should open its own pool, not reuse the parent's."""
+        pool = get_pool()
+        monkeypatch.setattr('server.storage.os.getpid', lambda: pool.pid + 1)
+
+        child_pool = get_pool()
+
+        assert child_pool is not pool
+        # The parent's connections are left open for the parent.
+        assert pool.writer.execute('SELECT 1').fetchone()[0] == 1
+
+    def test_get_connection_holds_write_lock(self, mock_storage_paths):
+        """get_connection should exclude pool writers while the block runs."""
+        with get_connection() as conn:
+            assert conn is get_pool().writer
+            assert not get_pool()._write_lock.acquire(blocking=False)
+
+
+class TestConnectionPool:
+    """Tests for the writer/reader connection pool."""
+
+    def test_reader_is_query_only(self, initialized_db):
+        """Pooled readers should refuse writes."""
+        with get_pool().read() as conn:
+            assert conn.execute('PRAGMA query_only').fetchone()[0] == 1
+            with pytest.raises(sqlite3.OperationalError):
+                conn.execute('DELETE FROM scans')
+
+    def test_readers_are_reused(self, initialized_db):
+        """A returned reader should be handed out again."""
+        pool = get_pool()
+        with pool.read() as first:
+            pass
+        with pool.read() as second:
+            pass
+
+        assert first is second
+        assert first is not pool.writer
+
+    def test_in_memory_reads_use_writer(self):
+        """In-memory databases should read through the writer."""
+        pool = ConnectionPool(':memory:')
+        with pool.write() as conn:
+            conn.execute('CREATE TABLE t (x INTEGER)')
+            conn.execute('INSERT INTO t VALUES (1)')
+
+        with pool.read() as conn:
+            assert conn is pool.writer
+            assert conn.execute('SELECT x FROM t').fetchone()[0] == 1
+        pool.close()
+
 
 class TestCreateScan:
     """Tests for scan creation."""
 
     def test_create_scan_returns_id(self, initialized_db, sample_scan_config):
-        """create_scan should return a valid UUID."""
+        """create_scan should return a valid ULID."""
         scan_id = create_scan('https://example.com', sample_scan_config)
 
         assert scan_id is not None
-        assert len(scan_id) == 36  # UUID format
+        assert len(scan_id) == 26  # ULID format
+        assert set(scan_id) <= set('0123456789ABCDEFGHJKMNPQRSTVWXYZ')
+
+    def test_create_scan_created_at_from_clock(
+        self, initialized_db, sample_scan_config, monkeypatch
+    ):
+        """create_scan and create_scans should stamp created_at from _clock."""
+        ticks = itertools.count()
+        monkeypatch.setattr(
+            'server.storage._clock', lambda: f'2024-01-01T00:00:{next(ticks):02d}Z'
+        )
+
+        first = create_scan('https://example.com', sample_scan_config)
+        rest = create_scans([('https://example.com', sample_scan_config)] * 2)
+
+        assert [get_scan(scan_id)['created_at'] for scan_id in [first, *rest]] == [
+            '2024-01-01T00:00:00Z', '2024-01-01T00:00:01Z', '2024-01-01T00:00:02Z'
+        ]
+
+    def test_create_scan_ids_sort_by_creation(self, initialized_db, sample_scan_config):
+        """IDs should sort in creation order, even within one millisecond."""
+        ids = [create_scan('https://example.com', sample_scan_config) for _ in range(50)]
+
+        assert ids == sorted(ids)
+        assert len(set(ids)) == 50
 
     def test_create_scan_stores_data(self, initialized_db, sample_scan_config):
         """create_scan should store all provided data."""
@@ -91,6 +195,14 @@ class TestCreateScan:
         assert scan['created_at'] is not None
         assert scan['created_at'].endswith('Z')
 
+    def test_create_scan_oversized_int(self, initialized_db, sample_scan_config):
+        """Ints beyond 64 bits in the config should still be stored."""
+        config = {**sample_scan_config, 'max_pages': 10 ** 20}
+
+        scan_id = create_scan('https://example.com', config)
+
+        assert json.loads(get_scan(scan_id)['config_json']) == config
+
     def test_create_scan_unique_ids(self, initialized_db, sample_scan_config):
         """Each scan should get a unique ID."""
         ids = set()
@@ -101,6 +213,24 @@ class TestCreateScan:
         assert len(ids) == 10
 
 
+class TestCreateScans:
+    """Tests for bulk scan creation."""
+
+    def test_create_scans_returns_ids_in_order(self, initialized_db, sample_scan_config):
+        """create_scans should return one ID per item, in input order."""
+        urls = [f'https://example{i}.com' for i in range(3)]
+
+        ids = create_scans((url, sample_scan_config) for url in urls)
+
+        assert [get_scan(scan_id)['target_url'] for scan_id in ids] == urls
+        assert all(get_scan(scan_id)['status'] == 'queued' for scan_id in ids)
+
+    def test_create_scans_empty(self, initialized_db):
+        """create_scans with no items should insert nothing."""
+        assert create_scans([]) == []
+        assert list_scans() == []
+
+
 class TestUpdateStatus:
     """Tests for status updates."""
 
@@ -154,6 +284,44 @@ class TestAttachResults:
         assert scan['report_json_path'] == json_path
 
 
+class TestFinalizeScan:
+    """Tests for finishing a scan."""
+
+    def test_finalize_scan_sets_paths_and_status(self, initialized_db, sample_scan_config):
+        """finalize_scan should store both paths and mark the scan finished."""
+        scan_id = create_scan('https://example.com', sample_scan_config)
+        update_status(scan_id, 'running')
+
+        finalize_scan(scan_id, '/data/reports/123.txt', '/data/reports/123.json')
+
+        scan = get_scan(scan_id)
+        assert scan['status'] == 'finished'
+        assert scan['report_text_path'] == '/data/reports/123.txt'
+        assert scan['report_json_path'] == '/data/reports/123.json'
+
+
+class TestFailScan:
+    """Tests for marking a scan failed."""
+
+    def test_fail_scan_sets_status_and_message(self, initialized_db, sample_scan_config):
+        """fail_scan should mark the scan failed with its error message."""
+        scan_id = create_scan('https://example.com', sample_scan_config)
+
+        fail_scan(scan_id, 'Navigation timeout')
+
+        scan = get_scan(scan_id)
+        assert scan['status'] == 'failed'
+        assert scan['error_message'] == 'Navigation timeout'
+
+    def test_fail_scan_truncates_message(self, initialized_db, sample_scan_config):
+        """fail_scan should store at most 200 characters of the message."""
+        scan_id = create_scan('https://example.com', sample_scan_config)
+
+        fail_scan(scan_id, 'x' * 500)
+
+        assert get_scan(scan_id)['error_message'] == 'x' * 200
+
+
 class TestGetScan:
     """Tests for fetching scans."""
 
@@ -191,22 +359,30 @@ class TestListScans:
     def test_list_scans_returns_all(self, initialized_db, sample_scan_config):
         """list_scans should return all scans."""
         urls = [f'https://example{i}.com' for i in range(5)]
-        for url in urls:
-            create_scan(url, sample_scan_config)
+        create_scans((url, sample_scan_config) for url in urls)
 
         scans = list_scans()
 
         assert len(scans) == 5
 
-    def test_list_scans_order_by_created_at_desc(self, initialized_db, sample_scan_config):
-        """list_scans should return scans newest first."""
-        import time
+    def test_list_scans_omits_config(self, initialized_db, sample_scan_config):
+        """list_scans should return listing columns but not config_json."""
+        scan_id = create_scan('https://example.com', sample_scan_config)
+        attach_results(scan_id, '/data/reports/1.txt', '/data/reports/1.json')
 
+        scan = list_scans()[0]
+
+        assert 'config_json' not in scan
+        assert scan['target_url'] == 'https://example.com'
+        assert scan['report_text_path'] == '/data/reports/1.txt'
+        assert scan['report_json_path'] == '/data/reports/1.json'
+
+    def test_list_scans_newest_first(self, initialized_db, sample_scan_config):
+        """list_scans should return scans newest first."""
         ids = []
         for i in range(3):
             scan_id = create_scan(f'https://example{i}.com', sample_scan_config)
             ids.append(scan_id)
-            time.sleep(0.01)  # Small delay to ensure different timestamps
 
         scans = list_scans()
 
@@ -216,8 +392,7 @@ class TestListScans:
 
     def test_list_scans_respects_limit(self, initialized_db, sample_scan_config):
         """list_scans should respect the limit parameter."""
-        for i in range(10):
-            create_scan(f'https://example{i}.com', sample_scan_config)
+        create_scans((f'https://example{i}.com', sample_scan_config) for i in range(10))
 
         scans = list_scans(limit=5)
 
@@ -265,4 +440,5 @@ class TestDataIntegrity:
         scan_id = create_scan('https://example.com', complex_config)
         scan = get_scan(scan_id)
 
+        assert isinstance(scan['config_json'], str)
         assert json.loads(scan['config_json']) == complex_config
@@ -1,5 +1,7 @@
 """Tests for utility functions in the scraper."""
 
+import re
+
 import pytest
 from pendo_feasibility_scraper import (
     url_allowed,
@@ -61,6 +63,26 @@ class TestUrlAllowed:
         assert url_allowed('https://example.com/Admin/', [], denylist) is False
         assert url_allowed('https://example.com/ADMIN/', [], denylist) is False
 
+    def test_backreferences_match_per_pattern(self):
+        """Backreferences should refer to their own pattern's groups."""
+        allowlist = [r'/(x)y/', r'/(a)\1/']
+
+        assert url_allowed('https://example.com/aa/', allowlist, []) is True
+        assert url_allowed('https://example.com/ax/', allowlist, []) is False
+
+    def test_conditionals_match_per_pattern(self):
+        """Numbered conditionals should refer to their own pattern's groups."""
+        allowlist = [r'/(x)/', r'/(a)?(?(1)b|c)/']
+
+        assert url_allowed('https://e.com/ab/', allowlist, []) is True
+        assert url_allowed('https://e.com/c/', allowlist, []) is True
+        assert url_allowed('https://e.com/ac/', allowlist, []) is False
+
+    def test_invalid_pattern_raises(self):
+        """An invalid pattern should raise even if others are valid."""
+        with pytest.raises(re.error):
+            url_allowed('https://example.com/b', [r'a)|(b'], [])
+
 
 class TestGetShortUrl:
     """Tests for URL shortening display function."""
@@ -87,6 +109,13 @@ class TestGetShortUrl:
         result = get_short_url('https://example.com/path/to/page', max_len=10)
         assert len(result) <= 10
 
+    def test_query_and_fragment_dropped(self):
+        """Query strings, fragments and params should not be shown."""
+        assert get_short_url('https://example.com/path?q=1#top') == '/path'
+        assert get_short_url('https://example.com?q=/x') == '/'
+        assert get_short_url('https://example.com/a;v=1') == '/a'
+        assert get_short_url('/relative/path') == '/relative/path'
+
 
 class TestDataClasses:
     """Tests for dataclass initialization and defaults."""
@@ -1,12 +1,44 @@
 """Background tasks for running scans."""
 
-import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Any
 
-from server.storage import update_status, attach_results, REPORTS_DIR
+import orjson
+import zstandard
+
+from server.storage import update_status, finalize_scan, fail_scan, REPORTS_DIR
 from pendo_feasibility_scraper import run_scan, ScrapeConfig
 
 
+# Level 3 is zstd's default: fast to encode, and JSON shrinks several-fold.
+_JSON_COMPRESSOR = zstandard.ZstdCompressor(level=3)
+
+
+def _write_report(path: Path, content: bytes) -> None:
+    """Write one encoded report file, replacing it atomically."""
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        with open(tmp_path, 'wb') as handle:
+            handle.write(content)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _fsync_dir(path: Path) -> None:
+    """Flush directory entries so renamed files survive a crash."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
 def run_scan_task(scan_id: str, payload: dict[str, Any]) -> None:
     """Run a scan and persist results."""
     update_status(scan_id, 'running')
@@ -15,14 +47,19 @@ def run_scan_task(scan_id: str, payload: dict[str, Any]) -> None:
         config = ScrapeConfig(**config_payload)
         result = run_scan(payload['target_url'], config)
         
-        REPORTS_DIR.mkdir(exist_ok=True)
         text_path = REPORTS_DIR / f'{scan_id}.txt'
-        json_path = REPORTS_DIR / f'{scan_id}.json'
+        json_path = REPORTS_DIR / f'{scan_id}.json.zst'
         
-        text_path.write_text(result.report_text, encoding='utf-8')
-        json_path.write_text(json.dumps(result.report_json, indent=2), encoding='utf-8')
+        report_json = _JSON_COMPRESSOR.compress(orjson.dumps(result.report_json))
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            # list() surfaces write errors to the except below.
+            list(pool.map(
+                _write_report,
+                (text_path, json_path),
+                (result.report_text.encode('utf-8'), report_json),
+            ))
+        _fsync_dir(REPORTS_DIR)
         
-        attach_results(scan_id, str(text_path), str(json_path))
-        update_status(scan_id, 'finished')
+        finalize_scan(scan_id, str(text_path), str(json_path))
     except Exception as exc:
-        update_status(scan_id, 'failed', error_message=str(exc)[:200])
+        fail_scan(scan_id, str(exc))
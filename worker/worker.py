@@ -1,16 +1,29 @@
 """RQ worker for scan jobs."""
 
 from redis import Redis
-from rq import Worker, Queue, Connection
+from rq import Queue, Worker
+from rq.worker_pool import WorkerPool
 from server.config import settings
+from server.storage import ensure_dirs
 
 
 def main() -> None:
-    """Start worker process."""
+    """Start one worker, or a pool of WORKER_CONCURRENCY workers."""
     redis = Redis.from_url(settings.redis_url)
-    with Connection(redis):
-        worker = Worker([Queue('default')])
-        worker.work()
+    # Created once here; run_scan_task assumes REPORTS_DIR exists.
+    ensure_dirs()
+    queue = Queue('default', connection=redis)
+    # Each job runs in a forked work horse, so a job timeout or a browser
+    # crash inside Playwright ends with that process instead of leaking into
+    # the worker. Storage connections are opened lazily by the first storage
+    # call inside the work horse; none are opened here to be inherited.
+    if settings.worker_concurrency <= 1:
+        Worker([queue], connection=redis).work()
+        return
+    # WorkerPool forwards SIGINT/SIGTERM to its workers for a warm shutdown
+    # and respawns any worker that dies.
+    pool = WorkerPool([queue], connection=redis, num_workers=settings.worker_concurrency)
+    pool.start()
 
 
 if __name__ == '__main__':